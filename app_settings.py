@@ -4,11 +4,17 @@ Persistent application settings.
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
+
+import fast_json
+
+# Recent-list updates arriving within this window are coalesced into one write.
+SAVE_DELAY_SECONDS = 0.25
 
 
 def _default_settings_path() -> Path:
@@ -58,29 +64,70 @@ class SettingsStore:
     def __init__(self, path: Path = None):
         self.path = Path(path) if path else _default_settings_path()
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending: Optional[AppSettings] = None
+        self._timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
 
     def load(self) -> AppSettings:
         if not self.path.exists():
             return AppSettings()
-        with open(self.path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        data = fast_json.loads(self.path.read_bytes())
         return AppSettings.from_dict(data)
 
     def save(self, settings: AppSettings) -> None:
-        with open(self.path, "w", encoding="utf-8") as handle:
-            json.dump(settings.to_dict(), handle, indent=2)
+        with self._lock:
+            # An explicit save supersedes any debounced one still waiting.
+            self._cancel_timer()
+            self._pending = None
+            self._write(settings)
+
+    def flush(self) -> None:
+        """Write a pending debounced save immediately, if there is one."""
+        with self._lock:
+            self._cancel_timer()
+            pending, self._pending = self._pending, None
+            if pending is not None:
+                self._write(pending)
+
+    def _schedule_save(self, settings: AppSettings) -> None:
+        with self._lock:
+            self._pending = settings
+            self._cancel_timer()
+            self._timer = threading.Timer(SAVE_DELAY_SECONDS, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _write(self, settings: AppSettings) -> None:
+        # Write to a sibling temp file and swap it in so a crash mid-write
+        # never leaves a truncated settings.json behind.
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(fast_json.dumps(settings.to_dict(), indent=True))
+        os.replace(tmp_path, self.path)
 
     def add_recent_dir(self, settings: AppSettings, directory: str, limit: int = 8) -> AppSettings:
-        directory = str(directory)
-        existing = [entry for entry in settings.recent_blueprint_dirs if entry != directory]
-        settings.recent_blueprint_dirs = [directory] + existing[: max(limit - 1, 0)]
-        self.save(settings)
+        updated = self._push_recent(settings.recent_blueprint_dirs, str(directory), limit)
+        if updated is not None:
+            settings.recent_blueprint_dirs = updated
+            self._schedule_save(settings)
         return settings
 
     def add_recent_blueprint(self, settings: AppSettings, blueprint_name: str, limit: int = 20) -> AppSettings:
-        blueprint_name = str(blueprint_name)
-        existing = [entry for entry in settings.recent_blueprints if entry != blueprint_name]
-        settings.recent_blueprints = [blueprint_name] + existing[: max(limit - 1, 0)]
-        self.save(settings)
+        updated = self._push_recent(settings.recent_blueprints, str(blueprint_name), limit)
+        if updated is not None:
+            settings.recent_blueprints = updated
+            self._schedule_save(settings)
         return settings
 
+    @staticmethod
+    def _push_recent(entries: List[str], entry: str, limit: int) -> Optional[List[str]]:
+        """Move entry to the front of a bounded MRU list; None when nothing changes."""
+        limit = max(limit, 1)
+        if entries[:1] == [entry] and len(entries) <= limit and entry not in entries[1:]:
+            return None
+        return [entry] + [existing for existing in entries if existing != entry][: limit - 1]
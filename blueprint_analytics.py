@@ -5,13 +5,17 @@ Blueprint analytics and resource cost engine.
 from __future__ import annotations
 
 import csv
-import json
+import os
+import re
+import threading
 import xml.etree.ElementTree as ET
-from collections import Counter, defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Mapping, Optional, Set
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
 
+import fast_json
 import safe_xml
 
 
@@ -19,6 +23,36 @@ SEVERITY_INFO = "Info"
 SEVERITY_WARNING = "Warning"
 SEVERITY_ERROR = "Error"
 
+# Parsed cost databases keyed by (path, mtime_ns); the data is treated as read-only.
+_DB_CACHE: Dict[Tuple[str, int], Dict] = {}
+
+# apply_fix only splices into files with exactly one grid and no empty CubeBlocks.
+_CUBE_GRID_OPEN = re.compile(rb"<CubeGrid[\s>]")
+_CUBE_BLOCKS_EMPTY = re.compile(rb"<CubeBlocks\s*/>")
+
+# Block inserted by apply_fix; the schema is fixed so it is emitted as text.
+_FIX_BLOCK_TEMPLATE = (
+    '<MyObjectBuilder_CubeBlock xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:type="{block_type}">'
+    "<SubtypeName>{subtype}</SubtypeName>"
+    '<Min x="0" y="0" z="0" />'
+    '<BlockOrientation Forward="Forward" Up="Up" />'
+    "</MyObjectBuilder_CubeBlock>"
+)
+
+_DIRECTIONS = ("Forward", "Backward", "Up", "Down", "Left", "Right")
+
+# Lowercase substring -> category, checked in order for subtypes without cost data.
+_CATEGORY_KEYWORDS = (
+    ("armor", "armor"),
+    ("thrust", "thrusters"),
+    ("turret", "weapons"),
+    ("gatling", "weapons"),
+    ("artillery", "weapons"),
+)
+_CONTROL_KEYWORDS = ("cockpit", "controlseat", "remotecontrol")
+_POWER_KEYWORDS = ("battery", "reactor", "hydrogenengine", "solar", "wind")
+
 
 @dataclass
 class HealthIssue:
@@ -66,104 +100,194 @@ class ConversionComparison:
     mass_delta: float
 
 
+@lru_cache(maxsize=4096)
+def _is_thruster(subtype: str) -> bool:
+    return "thrust" in subtype.lower()
+
+
+@lru_cache(maxsize=4096)
+def _infer_cost(subtype: str) -> Optional[Dict]:
+    """
+    Cost fallback for unknown armor variants and common blocks.
+    """
+    lowered = subtype.lower()
+    if "armor" in lowered:
+        if "heavy" in lowered:
+            steel = 150 if subtype.startswith("Large") else 5
+            pcu = 1 if subtype.startswith("Large") else 0
+            mass = 15100.0 if subtype.startswith("Large") else 30.0
+        else:
+            steel = 25 if subtype.startswith("Large") else 1
+            pcu = 1 if subtype.startswith("Large") else 0
+            mass = 2520.0 if subtype.startswith("Large") else 10.0
+        return {
+            "category": "armor",
+            "pcu": pcu,
+            "mass": mass,
+            "components": {"SteelPlate": steel},
+        }
+    if "thrust" in lowered:
+        return {
+            "category": "thrusters",
+            "pcu": 10,
+            "mass": 1500.0,
+            "components": {
+                "SteelPlate": 40,
+                "Construction": 20,
+                "Motor": 20,
+                "Thrust": 10,
+            },
+        }
+    if "reactor" in lowered or "generator" in lowered:
+        return {
+            "category": "power",
+            "pcu": 25,
+            "mass": 2000.0,
+            "components": {
+                "SteelPlate": 40,
+                "Construction": 20,
+                "Reactor": 10,
+            },
+        }
+    return None
+
+
 class BlockCostDatabase:
     """Loads block/component/ore conversion data from JSON."""
 
     def __init__(self, file_path: Path):
         self.file_path = Path(file_path)
-        with open(self.file_path, "r", encoding="utf-8") as handle:
-            data = json.load(handle)
+        key = (str(self.file_path), self.file_path.stat().st_mtime_ns)
+        data = _DB_CACHE.get(key)
+        if data is None:
+            data = fast_json.loads(self.file_path.read_bytes())
+            _DB_CACHE[key] = data
 
         self.metadata = data.get("metadata", {})
         self.component_to_ingot: Dict[str, Dict[str, float]] = data.get("component_to_ingot", {})
         self.ore_yields: Dict[str, float] = data.get("ore_yields", {})
         self.blocks: Dict[str, Dict] = data.get("blocks", {})
+        self._block_cache: Dict[str, Optional[Dict]] = {}
+        self._category_cache: Dict[str, str] = {}
+
+        # Component, ingot and ore names are interned to small ints so totals
+        # accumulate into flat lists and only become dicts on return. Conversion
+        # tables are precompiled once so per-analysis totals skip float coercion
+        # and ore-name formatting.
+        self._component_names: List[str] = sorted(
+            set(self.component_to_ingot).union(
+                *(block.get("components", {}) for block in self.blocks.values())
+            )
+        )
+        self._component_ids: Dict[str, int] = {name: i for i, name in enumerate(self._component_names)}
+        self._component_rows: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+        self._intern_lock = threading.Lock()
+
+        self._ingot_names: List[str] = sorted(
+            set(self.ore_yields).union(*self.component_to_ingot.values())
+        )
+        ingot_ids = {name: i for i, name in enumerate(self._ingot_names)}
+        self._ingots_per_component: Dict[str, Tuple[Tuple[int, float], ...]] = {
+            component: tuple((ingot_ids[ingot], float(qty)) for ingot, qty in conversion.items())
+            for component, conversion in self.component_to_ingot.items()
+            if conversion
+        }
+        self._ore_names: List[str] = [
+            f"{ingot} Ore" for ingot in self._ingot_names if self.ore_yields.get(ingot)
+        ]
+        ore_ids = {name: i for i, name in enumerate(self._ore_names)}
+        self._ore_per_ingot: Dict[str, Tuple[int, float]] = {
+            ingot: (ore_ids[f"{ingot} Ore"], 1.0 / float(yield_per_ore))
+            for ingot, yield_per_ore in self.ore_yields.items()
+            if yield_per_ore
+        }
 
     def get_block(self, subtype: str) -> Optional[Dict]:
-        if subtype in self.blocks:
-            return self.blocks[subtype]
-        return self._infer_cost(subtype)
+        try:
+            return self._block_cache[subtype]
+        except KeyError:
+            pass
+        block = self.blocks.get(subtype)
+        if block is None:
+            block = _infer_cost(subtype)
+        self._block_cache[subtype] = block
+        return block
 
     def known_block_ids(self) -> List[str]:
         return sorted(self.blocks.keys())
 
     def category_for_subtype(self, subtype: str) -> str:
+        try:
+            return self._category_cache[subtype]
+        except KeyError:
+            pass
         block = self.get_block(subtype)
         if block:
-            return block.get("category", "utility")
-
-        lowered = subtype.lower()
-        if "armor" in lowered:
-            return "armor"
-        if "thrust" in lowered:
-            return "thrusters"
-        if "turret" in lowered or "gatling" in lowered or "artillery" in lowered:
-            return "weapons"
-        return "utility"
+            category = block.get("category", "utility")
+        else:
+            lowered = subtype.lower()
+            category = next(
+                (name for keyword, name in _CATEGORY_KEYWORDS if keyword in lowered),
+                "utility",
+            )
+        self._category_cache[subtype] = category
+        return category
+
+    def component_totals(self, subtype_counts: Iterable[Tuple[str, int]]) -> Dict[str, int]:
+        """Sum component quantities for (subtype, block count) pairs."""
+        weighted = [(self._component_row(subtype), count) for subtype, count in subtype_counts]
+        totals = [0] * len(self._component_names)
+        for row, count in weighted:
+            for component_id, qty in row:
+                totals[component_id] += qty * count
+        names = self._component_names
+        return {names[i]: total for i, total in enumerate(totals) if total}
 
     def component_to_ingot_totals(self, components: Dict[str, int]) -> Dict[str, float]:
-        ingots: Dict[str, float] = defaultdict(float)
+        totals = [0.0] * len(self._ingot_names)
+        table = self._ingots_per_component
         for component, qty in components.items():
-            conversion = self.component_to_ingot.get(component)
-            if not conversion:
-                continue
-            for ingot, per_component in conversion.items():
-                ingots[ingot] += qty * float(per_component)
-        return dict(ingots)
+            for ingot_id, per_component in table.get(component, ()):
+                totals[ingot_id] += qty * per_component
+        names = self._ingot_names
+        return {names[i]: total for i, total in enumerate(totals) if total}
 
     def ingot_to_ore_totals(self, ingots: Dict[str, float]) -> Dict[str, float]:
-        ores: Dict[str, float] = defaultdict(float)
+        totals = [0.0] * len(self._ore_names)
+        table = self._ore_per_ingot
         for ingot, qty in ingots.items():
-            yield_per_ore = self.ore_yields.get(ingot)
-            if not yield_per_ore:
+            conversion = table.get(ingot)
+            if conversion is None:
                 continue
-            ores[f"{ingot} Ore"] += qty / float(yield_per_ore)
-        return dict(ores)
-
-    def _infer_cost(self, subtype: str) -> Optional[Dict]:
-        """
-        Cost fallback for unknown armor variants and common blocks.
-        """
-        lowered = subtype.lower()
-        if "armor" in lowered:
-            if "heavy" in lowered:
-                steel = 150 if subtype.startswith("Large") else 5
-                pcu = 1 if subtype.startswith("Large") else 0
-                mass = 15100.0 if subtype.startswith("Large") else 30.0
-            else:
-                steel = 25 if subtype.startswith("Large") else 1
-                pcu = 1 if subtype.startswith("Large") else 0
-                mass = 2520.0 if subtype.startswith("Large") else 10.0
-            return {
-                "category": "armor",
-                "pcu": pcu,
-                "mass": mass,
-                "components": {"SteelPlate": steel},
-            }
-        if "thrust" in lowered:
-            return {
-                "category": "thrusters",
-                "pcu": 10,
-                "mass": 1500.0,
-                "components": {
-                    "SteelPlate": 40,
-                    "Construction": 20,
-                    "Motor": 20,
-                    "Thrust": 10,
-                },
-            }
-        if "reactor" in lowered or "generator" in lowered:
-            return {
-                "category": "power",
-                "pcu": 25,
-                "mass": 2000.0,
-                "components": {
-                    "SteelPlate": 40,
-                    "Construction": 20,
-                    "Reactor": 10,
-                },
-            }
-        return None
+            ore_id, ore_per_ingot = conversion
+            totals[ore_id] += qty * ore_per_ingot
+        names = self._ore_names
+        return {names[i]: total for i, total in enumerate(totals) if total}
+
+    def _component_row(self, subtype: str) -> Tuple[Tuple[int, int], ...]:
+        try:
+            return self._component_rows[subtype]
+        except KeyError:
+            pass
+        block = self.get_block(subtype)
+        components = block.get("components", {}) if block else {}
+        row = tuple((self._component_id(name), int(qty)) for name, qty in components.items())
+        self._component_rows[subtype] = row
+        return row
+
+    def _component_id(self, name: str) -> int:
+        try:
+            return self._component_ids[name]
+        except KeyError:
+            pass
+        # Inferred costs can name components the JSON does not list.
+        with self._intern_lock:
+            component_id = self._component_ids.get(name)
+            if component_id is None:
+                component_id = len(self._component_names)
+                self._component_names.append(name)
+                self._component_ids[name] = component_id
+            return component_id
 
 
 class BlueprintAnalyticsEngine:
@@ -173,50 +297,72 @@ class BlueprintAnalyticsEngine:
         self.db = BlockCostDatabase(cost_db_path)
 
     def analyze_blueprint(self, blueprint_file: Path) -> BlueprintAnalyticsResult:
-        tree = safe_xml.parse(blueprint_file)
-        root = tree.getroot()
-        grid_size = self._detect_grid_size(root)
-
-        blocks = root.findall(".//CubeGrid/CubeBlocks/MyObjectBuilder_CubeBlock")
-        subtype_counts: Dict[str, int] = Counter()
-        component_totals: Dict[str, int] = defaultdict(int)
-        category_totals: Dict[str, int] = defaultdict(int)
+        grid_size = "Unknown"
+        # Plain dicts: Counter += 1 is about twice as slow per block.
+        subtype_counts: Dict[str, int] = {}
+        costed: List[Tuple[str, int]] = []
+        category_totals: Dict[str, int] = {}
         unknown_subtypes: Set[str] = set()
         pcu_total = 0
         mass_total = 0.0
+        thruster_directions: Counter[str] = Counter()
+        thruster_blocks = 0
 
-        for block in blocks:
-            subtype = self._get_block_subtype(block)
-            if not subtype:
+        # Single streaming pass; safe_xml discards each block once counted.
+        for elem in safe_xml.iter_grid_elements(blueprint_file):
+            if elem.tag == "GridSizeEnum":
+                if grid_size == "Unknown" and elem.text:
+                    grid_size = elem.text.strip()
                 continue
-            subtype_counts[subtype] += 1
 
+            subtype = self._get_block_subtype(elem)
+            if subtype:
+                try:
+                    subtype_counts[subtype] += 1
+                except KeyError:
+                    subtype_counts[subtype] = 1
+
+                if _is_thruster(subtype):
+                    thruster_blocks += 1
+                    orientation = elem.find("BlockOrientation")
+                    if orientation is not None:
+                        forward = orientation.attrib.get("Forward")
+                        if forward:
+                            thruster_directions[forward] += 1
+
+        # Costs are folded once per unique subtype rather than once per block.
+        for subtype, count in subtype_counts.items():
             block_cost = self.db.get_block(subtype)
             if not block_cost:
                 unknown_subtypes.add(subtype)
-                category_totals["unknown"] += 1
+                category_totals["unknown"] = category_totals.get("unknown", 0) + count
                 continue
-
             category = block_cost.get("category", "utility")
-            category_totals[category] += 1
-            pcu_total += int(block_cost.get("pcu", 0))
-            mass_total += float(block_cost.get("mass", 0.0))
-            for component, qty in block_cost.get("components", {}).items():
-                component_totals[component] += int(qty)
+            category_totals[category] = category_totals.get(category, 0) + count
+            pcu_total += int(block_cost.get("pcu", 0)) * count
+            mass_total += float(block_cost.get("mass", 0.0)) * count
+            costed.append((subtype, count))
 
+        component_totals = self.db.component_totals(costed)
         ingot_totals = self.db.component_to_ingot_totals(component_totals)
         ore_totals = self.db.ingot_to_ore_totals(ingot_totals)
-        issues = self._run_health_audit(root, subtype_counts, sorted(unknown_subtypes))
+        unknown_sorted = sorted(unknown_subtypes)
+        issues = self._run_health_audit(
+            subtype_counts,
+            unknown_sorted,
+            self._thruster_balance(thruster_directions, thruster_blocks),
+        )
 
         return BlueprintAnalyticsResult(
             blueprint_name=Path(blueprint_file).parent.name,
             block_count=sum(subtype_counts.values()),
-            block_counts=dict(sorted(subtype_counts.items())),
-            category_counts=dict(sorted(category_totals.items())),
-            unknown_subtypes=sorted(unknown_subtypes),
-            component_totals=dict(sorted(component_totals.items())),
-            ingot_totals=dict(sorted(ingot_totals.items())),
-            ore_totals=dict(sorted(ore_totals.items())),
+            # Ordering is left to the exporters/renderers that display these.
+            block_counts=subtype_counts,
+            category_counts=category_totals,
+            unknown_subtypes=unknown_sorted,
+            component_totals=component_totals,
+            ingot_totals=ingot_totals,
+            ore_totals=ore_totals,
             pcu_total=pcu_total,
             mass_total=round(mass_total, 2),
             grid_size=grid_size,
@@ -228,10 +374,18 @@ class BlueprintAnalyticsEngine:
         blueprint_file: Path,
         mapping: Dict[str, str],
         mode: str,
+        *,
+        result: Optional[BlueprintAnalyticsResult] = None,
     ) -> ConversionComparison:
-        result = self.analyze_blueprint(blueprint_file)
+        """
+        Compare costs before and after applying mapping.
 
-        after_components: Dict[str, int] = defaultdict(int)
+        Pass a result from analyze_blueprint to skip re-reading the file.
+        """
+        if result is None:
+            result = self.analyze_blueprint(blueprint_file)
+
+        after_costed: List[Tuple[str, int]] = []
         after_pcu = 0
         after_mass = 0.0
         block_changes: Dict[str, int] = {}
@@ -246,9 +400,9 @@ class BlueprintAnalyticsEngine:
                 continue
             after_pcu += int(block_cost.get("pcu", 0)) * count
             after_mass += float(block_cost.get("mass", 0.0)) * count
-            for component, qty in block_cost.get("components", {}).items():
-                after_components[component] += int(qty) * count
+            after_costed.append((target_subtype, count))
 
+        after_components = self.db.component_totals(after_costed)
         before_components = result.component_totals
         before_ingots = result.ingot_totals
         before_ores = result.ore_totals
@@ -262,16 +416,16 @@ class BlueprintAnalyticsEngine:
 
         return ConversionComparison(
             mode=mode,
-            block_changes=dict(sorted(block_changes.items())),
-            before_components=dict(sorted(before_components.items())),
-            after_components=dict(sorted(after_components.items())),
-            component_delta=dict(sorted(component_delta.items())),
-            before_ingots=dict(sorted(before_ingots.items())),
-            after_ingots=dict(sorted(after_ingots.items())),
-            ingot_delta=dict(sorted(ingot_delta.items())),
-            before_ores=dict(sorted(before_ores.items())),
-            after_ores=dict(sorted(after_ores.items())),
-            ore_delta=dict(sorted(ore_delta.items())),
+            block_changes=block_changes,
+            before_components=before_components,
+            after_components=after_components,
+            component_delta=component_delta,
+            before_ingots=before_ingots,
+            after_ingots=after_ingots,
+            ingot_delta=ingot_delta,
+            before_ores=before_ores,
+            after_ores=after_ores,
+            ore_delta=ore_delta,
             before_pcu=result.pcu_total,
             after_pcu=after_pcu,
             pcu_delta=after_pcu - result.pcu_total,
@@ -284,87 +438,135 @@ class BlueprintAnalyticsEngine:
     def export_comparison_csv(comparison: ConversionComparison, destination: Path) -> Path:
         destination = Path(destination)
         destination.parent.mkdir(parents=True, exist_ok=True)
-        with open(destination, "w", newline="", encoding="utf-8") as handle:
+        with open(destination, "w", newline="", encoding="utf-8", buffering=128 * 1024) as handle:
             writer = csv.writer(handle)
-            writer.writerow(["Metric", "Before", "After", "Delta"])
-            writer.writerow(["PCU", comparison.before_pcu, comparison.after_pcu, comparison.pcu_delta])
-            writer.writerow(["Mass", comparison.before_mass, comparison.after_mass, comparison.mass_delta])
-            writer.writerow([])
-            writer.writerow(["Component", "Before", "After", "Delta"])
-            for key in sorted(set(comparison.before_components) | set(comparison.after_components)):
-                writer.writerow(
-                    [
-                        key,
-                        comparison.before_components.get(key, 0),
-                        comparison.after_components.get(key, 0),
-                        comparison.component_delta.get(key, 0),
-                    ]
-                )
+            writer.writerows(
+                [
+                    ["Metric", "Before", "After", "Delta"],
+                    ["PCU", comparison.before_pcu, comparison.after_pcu, comparison.pcu_delta],
+                    ["Mass", comparison.before_mass, comparison.after_mass, comparison.mass_delta],
+                    [],
+                ]
+            )
+            BlueprintAnalyticsEngine._emit_delta_section(
+                writer,
+                "Component",
+                comparison.before_components,
+                comparison.after_components,
+                comparison.component_delta,
+            )
             writer.writerow([])
-            writer.writerow(["Ingot", "Before", "After", "Delta"])
-            for key in sorted(set(comparison.before_ingots) | set(comparison.after_ingots)):
-                writer.writerow(
-                    [
-                        key,
-                        round(comparison.before_ingots.get(key, 0.0), 3),
-                        round(comparison.after_ingots.get(key, 0.0), 3),
-                        round(comparison.ingot_delta.get(key, 0.0), 3),
-                    ]
-                )
+            BlueprintAnalyticsEngine._emit_delta_section(
+                writer,
+                "Ingot",
+                comparison.before_ingots,
+                comparison.after_ingots,
+                comparison.ingot_delta,
+                ndigits=3,
+            )
             writer.writerow([])
-            writer.writerow(["Ore", "Before", "After", "Delta"])
-            for key in sorted(set(comparison.before_ores) | set(comparison.after_ores)):
-                writer.writerow(
-                    [
-                        key,
-                        round(comparison.before_ores.get(key, 0.0), 3),
-                        round(comparison.after_ores.get(key, 0.0), 3),
-                        round(comparison.ore_delta.get(key, 0.0), 3),
-                    ]
-                )
+            BlueprintAnalyticsEngine._emit_delta_section(
+                writer,
+                "Ore",
+                comparison.before_ores,
+                comparison.after_ores,
+                comparison.ore_delta,
+                ndigits=3,
+            )
         return destination
 
+    @staticmethod
+    def _emit_delta_section(
+        writer: Any,
+        label: str,
+        before: Mapping[str, float],
+        after: Mapping[str, float],
+        delta: Mapping[str, float],
+        ndigits: Optional[int] = None,
+    ) -> None:
+        writer.writerow([label, "Before", "After", "Delta"])
+        keys = sorted(before.keys() | after.keys())
+        if ndigits is None:
+            writer.writerows([key, before.get(key, 0), after.get(key, 0), delta.get(key, 0)] for key in keys)
+            return
+        writer.writerows(
+            [
+                key,
+                round(before.get(key, 0.0), ndigits),
+                round(after.get(key, 0.0), ndigits),
+                round(delta.get(key, 0.0), ndigits),
+            ]
+            for key in keys
+        )
+
     @staticmethod
     def export_comparison_text(comparison: ConversionComparison, destination: Path) -> Path:
         destination = Path(destination)
         destination.parent.mkdir(parents=True, exist_ok=True)
-        lines: List[str] = []
-        lines.append(f"Mode: {comparison.mode}")
-        lines.append(f"PCU: {comparison.before_pcu} -> {comparison.after_pcu} (delta {comparison.pcu_delta:+d})")
-        lines.append(
+        lines: List[str] = [
+            f"Mode: {comparison.mode}",
+            f"PCU: {comparison.before_pcu} -> {comparison.after_pcu} (delta {comparison.pcu_delta:+d})",
             f"Mass: {comparison.before_mass:.2f} -> {comparison.after_mass:.2f} "
-            f"(delta {comparison.mass_delta:+.2f})"
-        )
-        lines.append("")
-        lines.append("Block changes:")
-        for change, count in comparison.block_changes.items():
-            lines.append(f"  {change} (x{count})")
+            f"(delta {comparison.mass_delta:+.2f})",
+            "",
+            "Block changes:",
+        ]
+        lines.extend(["  %s (x%d)" % item for item in sorted(comparison.block_changes.items())])
         lines.append("")
         lines.append("Component deltas:")
-        for component, component_delta_value in sorted(comparison.component_delta.items()):
-            lines.append(f"  {component}: {component_delta_value:+d}")
+        lines.extend(["  %s: %+d" % item for item in sorted(comparison.component_delta.items())])
         lines.append("")
         lines.append("Ingot deltas:")
-        for ingot, ingot_delta_value in sorted(comparison.ingot_delta.items()):
-            lines.append(f"  {ingot}: {ingot_delta_value:+.3f}")
+        lines.extend(["  %s: %+.3f" % item for item in sorted(comparison.ingot_delta.items())])
         lines.append("")
         lines.append("Ore deltas:")
-        for ore, ore_delta_value in sorted(comparison.ore_delta.items()):
-            lines.append(f"  {ore}: {ore_delta_value:+.3f}")
+        lines.extend(["  %s: %+.3f" % item for item in sorted(comparison.ore_delta.items())])
 
-        with open(destination, "w", encoding="utf-8") as handle:
-            handle.write("\n".join(lines))
+        destination.write_text("\n".join(lines), encoding="utf-8")
         return destination
 
     def apply_fix(self, blueprint_file: Path, fix_id: str) -> bool:
+        blueprint_file = Path(blueprint_file)
+        raw = blueprint_file.read_bytes()
+        # Single-grid blueprints get the new block spliced in front of the
+        # closing tag instead of re-serializing the whole file; anything else
+        # (multi-grid, projections, self-closing CubeBlocks) takes the tree path.
+        if (
+            raw.count(b"</CubeBlocks>") != 1
+            or len(_CUBE_GRID_OPEN.findall(raw)) != 1
+            or _CUBE_BLOCKS_EMPTY.search(raw)
+        ):
+            return self._apply_fix_tree(blueprint_file, fix_id)
+
+        new_block = self._fix_block_xml(fix_id, self._scan_grid_size(blueprint_file))
+        if new_block is None:
+            return False
+
+        index = raw.rfind(b"</CubeBlocks>")
+        block_bytes = new_block.encode("utf-8")
+        tmp_path = blueprint_file.with_name(blueprint_file.name + ".tmp")
+        tmp_path.write_bytes(raw[:index] + block_bytes + raw[index:])
+        os.replace(tmp_path, blueprint_file)
+        return True
+
+    def _apply_fix_tree(self, blueprint_file: Path, fix_id: str) -> bool:
         tree = safe_xml.parse(blueprint_file)
         root = tree.getroot()
         cube_blocks = root.find(".//CubeGrid/CubeBlocks")
         if cube_blocks is None:
             return False
 
-        grid_size = self._detect_grid_size(root)
+        new_block = self._fix_block_xml(fix_id, self._detect_grid_size(root))
+        if new_block is None:
+            return False
+
+        # The template is a trusted constant, so the stdlib parser is fine here.
+        cube_blocks.append(ET.fromstring(new_block))
+        tree.write(blueprint_file, encoding="utf-8", xml_declaration=True)
+        return True
 
+    @staticmethod
+    def _fix_block_xml(fix_id: str, grid_size: str) -> Optional[str]:
         if fix_id == "add_control_block":
             subtype = "LargeBlockCockpit" if grid_size == "Large" else "SmallBlockCockpit"
             block_type = "MyObjectBuilder_Cockpit"
@@ -372,17 +574,8 @@ class BlueprintAnalyticsEngine:
             subtype = "LargeBlockBatteryBlock" if grid_size == "Large" else "SmallBlockBatteryBlock"
             block_type = "MyObjectBuilder_BatteryBlock"
         else:
-            return False
-
-        new_block = ET.SubElement(cube_blocks, "MyObjectBuilder_CubeBlock")
-        new_block.set("{http://www.w3.org/2001/XMLSchema-instance}type", block_type)
-        ET.SubElement(new_block, "SubtypeName").text = subtype
-        ET.SubElement(new_block, "Min").attrib.update({"x": "0", "y": "0", "z": "0"})
-        ET.SubElement(new_block, "BlockOrientation").attrib.update(
-            {"Forward": "Forward", "Up": "Up"}
-        )
-        tree.write(blueprint_file, encoding="utf-8", xml_declaration=True)
-        return True
+            return None
+        return _FIX_BLOCK_TEMPLATE.format(block_type=block_type, subtype=subtype)
 
     @staticmethod
     def _get_block_subtype(block: ET.Element) -> Optional[str]:
@@ -394,6 +587,14 @@ class BlueprintAnalyticsEngine:
             return subtype_id.text.strip()
         return None
 
+    @staticmethod
+    def _scan_grid_size(blueprint_file: Path) -> str:
+        """Stream until the first CubeGrid/GridSizeEnum instead of parsing the whole file."""
+        for elem in safe_xml.iter_grid_elements(blueprint_file):
+            if elem.tag == "GridSizeEnum" and elem.text:
+                return elem.text.strip()
+        return "Unknown"
+
     @staticmethod
     def _detect_grid_size(root: ET.Element) -> str:
         element = root.find(".//CubeGrid/GridSizeEnum")
@@ -403,36 +604,34 @@ class BlueprintAnalyticsEngine:
 
     @staticmethod
     def _numeric_delta(before: Mapping[str, float], after: Mapping[str, float]) -> Dict[str, float]:
-        keys = set(before.keys()) | set(after.keys())
-        return {key: after.get(key, 0) - before.get(key, 0) for key in keys}
+        # Unchanged entries are omitted; exporters treat missing keys as zero.
+        delta = {key: after.get(key, 0.0) - qty for key, qty in before.items()}
+        delta.update((key, qty) for key, qty in after.items() if key not in before)
+        return {key: value for key, value in delta.items() if value}
 
     @staticmethod
     def _int_delta(before: Mapping[str, int], after: Mapping[str, int]) -> Dict[str, int]:
-        keys = set(before.keys()) | set(after.keys())
-        return {key: int(after.get(key, 0) - before.get(key, 0)) for key in keys}
+        delta = Counter(after)
+        delta.subtract(before)
+        return {key: int(value) for key, value in delta.items() if value}
 
     def _run_health_audit(
         self,
-        root: ET.Element,
         subtype_counts: Dict[str, int],
         unknown_subtypes: List[str],
+        thruster_balance: Optional[str],
     ) -> List[HealthIssue]:
         issues: List[HealthIssue] = []
-        subtype_keys = list(subtype_counts.keys())
-        lowered = [s.lower() for s in subtype_keys]
+        has_control = has_power = False
+        for subtype in subtype_counts:
+            lowered = subtype.lower()
+            if not has_control and any(keyword in lowered for keyword in _CONTROL_KEYWORDS):
+                has_control = True
+            if not has_power and any(keyword in lowered for keyword in _POWER_KEYWORDS):
+                has_power = True
+            if has_control and has_power:
+                break
 
-        has_control = any(
-            key for key in lowered if "cockpit" in key or "controlseat" in key or "remotecontrol" in key
-        )
-        has_power = any(
-            key
-            for key in lowered
-            if "battery" in key
-            or "reactor" in key
-            or "hydrogenengine" in key
-            or "solar" in key
-            or "wind" in key
-        )
         if not has_control:
             issues.append(
                 HealthIssue(
@@ -454,7 +653,6 @@ class BlueprintAnalyticsEngine:
                 )
             )
 
-        thruster_balance = self._thruster_balance(root)
         if thruster_balance:
             issues.append(
                 HealthIssue(
@@ -477,33 +675,16 @@ class BlueprintAnalyticsEngine:
 
         return issues
 
-    def _thruster_balance(self, root: ET.Element) -> Optional[str]:
-        directions: Counter[str] = Counter()
-        thruster_blocks = 0
-        for block in root.findall(".//CubeGrid/CubeBlocks/MyObjectBuilder_CubeBlock"):
-            subtype = self._get_block_subtype(block)
-            if not subtype:
-                continue
-            if "thrust" not in subtype.lower():
-                continue
-            thruster_blocks += 1
-            orientation = block.find("BlockOrientation")
-            if orientation is None:
-                continue
-            forward = orientation.attrib.get("Forward")
-            if forward:
-                directions[forward] += 1
-
+    @staticmethod
+    def _thruster_balance(directions: Counter[str], thruster_blocks: int) -> Optional[str]:
         if thruster_blocks < 6:
             return None
 
-        missing = [direction for direction in ("Forward", "Backward", "Up", "Down", "Left", "Right") if directions[direction] == 0]
-        if missing:
+        counts = [directions[direction] for direction in _DIRECTIONS]
+        lowest = min(counts)
+        if lowest == 0:
+            missing = [direction for direction, count in zip(_DIRECTIONS, counts) if count == 0]
             return f"Thrusters are missing in direction(s): {', '.join(missing)}."
-
-        counts = [directions[d] for d in ("Forward", "Backward", "Up", "Down", "Left", "Right")]
-        if min(counts) == 0:
-            return None
-        if max(counts) / min(counts) >= 2.5:
+        if max(counts) / lowest >= 2.5:
             return "Thruster distribution appears heavily unbalanced across directions."
         return None
@@ -3,13 +3,56 @@ Blueprint Converter Module
 Handles safe copying and block conversion of Space Engineers blueprints.
 """
 
+import os
 import shutil
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 
+import safe_xml
 from se_armor_replacer import ArmorBlockReplacer
 
 
+def _clone_file(src: str, dst: str) -> str:
+    """
+    copytree copy_function that lets the kernel share extents where it can.
+
+    os.copy_file_range reflinks on copy-on-write filesystems (Btrfs, XFS) and
+    otherwise copies in-kernel; unsupported platforms fall back to copy2.
+    Hardlinks are deliberately avoided since the game may rewrite files such
+    as thumb.png in place, which would modify the source blueprint too.
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+    return shutil.copy2(src, dst)
+
+
+def _top_level_ignore(root: Path, names: Set[str]) -> Callable[[str, List[str]], Set[str]]:
+    """copytree ignore callback that skips the given names only in the root folder."""
+    root_str = os.fspath(root)
+
+    def ignore(directory: str, entries: List[str]) -> Set[str]:
+        return names.intersection(entries) if os.fspath(directory) == root_str else set()
+
+    return ignore
+
+
+# Rewritten from the source (bp.sbc) or invalidated by the rewrite (bp.sbcB5).
+_REGENERATED_FILES = {"bp.sbc", "bp.sbcB5"}
+
+
 class BlueprintConverter:
     """Converts blueprints by copying and applying selected mapping categories."""
 
@@ -38,6 +81,14 @@ class BlueprintConverter:
         )
         self.prefix = self._select_prefix()
         self._history: List[Path] = []
+        # Keyed on the prefix too, so reassigning self.prefix never serves stale paths.
+        self._dest_cache: Dict[Tuple[str, str], Path] = {}
+
+    def set_reverse(self, reverse: bool) -> None:
+        """Switch conversion direction without rebuilding the replacer."""
+        self.reverse = reverse
+        self.replacer.set_reverse(reverse)
+        self.prefix = self._select_prefix()
 
     def _select_prefix(self) -> str:
         normalized = [name.lower() for name in self.enabled_categories]
@@ -65,29 +116,51 @@ class BlueprintConverter:
         bp_file = source_path / "bp.sbc"
         if not bp_file.exists():
             raise ValueError(f"No bp.sbc found in: {source_path}")
+        if not self._has_convertible_blocks(bp_file):
+            raise ValueError(f"No convertible blocks for the selected categories in: {source_path.name}")
 
         dest_path = self.get_destination_path(source_path)
         if dest_path.exists():
             self.log(f"Destination exists, removing: {dest_path}")
             shutil.rmtree(dest_path)
 
+        # Copy everything except bp.sbc/bp.sbcB5: the converted bp.sbc is written
+        # straight from the source, and the binary cache would be stale anyway.
         self.log(f"Copying blueprint folder: {source_path.name} -> {dest_path.name}")
-        shutil.copytree(source_path, dest_path)
-
-        binary_bp_file = dest_path / "bp.sbcB5"
-        if binary_bp_file.exists():
-            self.log(f"Removing binary blueprint cache: {binary_bp_file}")
-            binary_bp_file.unlink()
+        shutil.copytree(
+            source_path,
+            dest_path,
+            copy_function=_clone_file,
+            ignore=_top_level_ignore(source_path, _REGENERATED_FILES),
+        )
 
         new_bp_file = dest_path / "bp.sbc"
         blocks_scanned, replacements = self.replacer.process_blueprint(
-            str(new_bp_file),
+            str(bp_file),
+            output_path=str(new_bp_file),
             create_backup=False,
         )
         self.log(f"Conversion complete ({replacements} replacement(s))")
         self._history.append(dest_path)
         return dest_path, blocks_scanned, replacements
 
+    def _has_convertible_blocks(self, bp_file: Path) -> bool:
+        """
+        Cheap streaming precheck that stops at the first mapped subtype.
+
+        Looks at every SubtypeName/SubtypeId, so it can only over-report
+        compared to the replacer, never skip a blueprint it would convert.
+        """
+        mapping = self.replacer.mapping
+        for _, elem in safe_xml.iterparse(bp_file, events=("end",)):
+            tag = elem.tag
+            if tag == "SubtypeName" or tag == "SubtypeId":
+                if elem.text and elem.text.strip() in mapping:
+                    return True
+            elif tag == "MyObjectBuilder_CubeBlock":
+                elem.clear()
+        return False
+
     def create_heavy_armor_blueprint(self, source_path: Path) -> Tuple[Path, int, int]:
         """
         Backward-compatible wrapper for existing callers.
@@ -95,8 +168,13 @@ class BlueprintConverter:
         return self.create_converted_blueprint(source_path)
 
     def get_destination_path(self, source_path: Path) -> Path:
-        source_path = Path(source_path)
-        return source_path.parent / f"{self.prefix}{source_path.name}"
+        key = (self.prefix, str(source_path))
+        dest_path = self._dest_cache.get(key)
+        if dest_path is None:
+            source_path = Path(source_path)
+            dest_path = source_path.parent / f"{self.prefix}{source_path.name}"
+            self._dest_cache[key] = dest_path
+        return dest_path
 
     def check_destination_exists(self, source_path: Path) -> bool:
         return self.get_destination_path(source_path).exists()
@@ -152,17 +230,17 @@ class BlueprintConverter:
         if dest_path.exists():
             shutil.rmtree(dest_path)
 
-        shutil.copytree(source_path, dest_path)
-
-        binary_bp_file = dest_path / "bp.sbcB5"
-        if binary_bp_file.exists():
-            binary_bp_file.unlink()
+        shutil.copytree(
+            source_path,
+            dest_path,
+            copy_function=_clone_file,
+            ignore=_top_level_ignore(source_path, _REGENERATED_FILES),
+        )
 
         new_bp_file = dest_path / "bp.sbc"
         
         # Parse XML, scale the grid size and swap subtypes!
-        import safe_xml
-        tree = safe_xml.parse(new_bp_file)
+        tree = safe_xml.parse(bp_file)
         root = tree.getroot()
         
         # 1. Update GridSizeEnum
@@ -3,18 +3,37 @@ Blueprint Scanner Module
 Scans Space Engineers blueprint directories and extracts metadata.
 """
 
+import bisect
+import hashlib
+import multiprocessing
 import os
+import sys
 import xml.etree.ElementTree as ET
-from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
+import fast_json
 import safe_xml
 from mappings import MappingRegistry, build_registry
 from se_armor_replacer import ArmorBlockReplacer
 
 
+_LIGHT_FLAG = 1
+_HEAVY_FLAG = 2
+
+# (armor flags, mapping categories containing the subtype, "source->target" key)
+SubtypeInfo = Tuple[int, Tuple[str, ...], Optional[str]]
+
+# Folders with at least this many uncached blueprints are parsed in worker processes.
+PARALLEL_SCAN_THRESHOLD = 16
+
+# Bump when _parse_blueprint output changes so stale scan caches are ignored.
+_SCAN_CACHE_VERSION = 1
+
+
 @dataclass
 class BlueprintInfo:
     """Information about a Space Engineers blueprint."""
@@ -41,41 +60,153 @@ class BlueprintInfo:
             "light_armor_count": self.light_armor_count,
             "heavy_armor_count": self.heavy_armor_count,
             "has_bp_file": self.has_bp_file,
-            "subtype_counts": self.subtype_counts,
-            "category_counts": self.category_counts,
-            "convertible_counts": self.convertible_counts,
+            # Counts are kept in encounter order; sort only when serializing.
+            "subtype_counts": dict(sorted(self.subtype_counts.items())),
+            "category_counts": dict(sorted(self.category_counts.items())),
+            "convertible_counts": dict(sorted(self.convertible_counts.items())),
         }
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> "BlueprintInfo":
+        return cls(
+            name=data["name"],
+            path=Path(data["path"]),
+            display_name=data["display_name"],
+            grid_size=data["grid_size"],
+            block_count=int(data["block_count"]),
+            light_armor_count=int(data["light_armor_count"]),
+            heavy_armor_count=int(data["heavy_armor_count"]),
+            has_bp_file=bool(data["has_bp_file"]),
+            subtype_counts=dict(data.get("subtype_counts", {})),
+            category_counts=dict(data.get("category_counts", {})),
+            convertible_counts=dict(data.get("convertible_counts", {})),
+        )
+
 
 class BlueprintScanner:
     """Scans and manages Space Engineers blueprints."""
 
-    LIGHT_ARMOR_BLOCKS = set(ArmorBlockReplacer.LIGHT_TO_HEAVY.keys())
-    HEAVY_ARMOR_BLOCKS = set(ArmorBlockReplacer.LIGHT_TO_HEAVY.values())
+    # Kept for callers that test membership directly; scans use the subtype index.
+    LIGHT_ARMOR_BLOCKS = frozenset(ArmorBlockReplacer.LIGHT_TO_HEAVY.keys())
+    HEAVY_ARMOR_BLOCKS = frozenset(ArmorBlockReplacer.LIGHT_TO_HEAVY.values())
 
     def __init__(
         self,
         registry: Optional[MappingRegistry] = None,
         enabled_categories: Optional[Sequence[str]] = None,
+        cache_path: Optional[Path] = None,
     ):
+        """
+        Args:
+            cache_path: Optional JSON file used to remember scan results of
+                unchanged bp.sbc files (matched on size and mtime) across runs.
+        """
         self.registry = registry if registry else build_registry(include_builtin=True)
+        # The registry is not modified after the scanner is built (the GUI builds
+        # a new scanner when profiles are reloaded), so its categories and every
+        # per-selection mapping/index can be cached here.
+        self._categories = self.registry.list_categories()
+        self._selection_cache: Dict[Tuple[str, ...], Tuple[Dict[str, str], Dict[str, SubtypeInfo], str]] = {}
         self.enabled_categories = (
-            [category.name for category in self.registry.list_categories()]
+            [category.name for category in self._categories]
             if enabled_categories is None
             else list(enabled_categories)
         )
         self.blueprints_cache: List[BlueprintInfo] = []
-        self._mapping = self.registry.build_mapping(
-            reverse=False,
-            enabled_categories=self.enabled_categories,
-        )
+        # Lowercased names and light-armor ordering of blueprints_cache, rebuilt
+        # whenever that list is replaced.
+        self._filter_source: Optional[List[BlueprintInfo]] = None
+        self._filter_index: List[Tuple[str, str, int]] = []
+        self._light_counts: List[int] = []
+        self._light_order: List[int] = []
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._scan_cache: Optional[Dict[str, Dict]] = None
+        self._cache_signature: Optional[str] = None
+        self._apply_enabled_categories()
 
     def set_enabled_categories(self, enabled_categories: Sequence[str]) -> None:
-        self.enabled_categories = list(enabled_categories)
-        self._mapping = self.registry.build_mapping(
-            reverse=False,
-            enabled_categories=self.enabled_categories,
-        )
+        enabled_categories = list(enabled_categories)
+        if enabled_categories == self.enabled_categories:
+            return
+        previous = self.enabled_categories
+        self.enabled_categories = enabled_categories
+        try:
+            self._apply_enabled_categories()
+        except Exception:
+            self.enabled_categories = previous
+            raise
+
+    def _apply_enabled_categories(self) -> None:
+        previous_signature = self._cache_signature
+        key = tuple(self.enabled_categories)
+        cached = self._selection_cache.get(key)
+        if cached is None:
+            self._mapping = self.registry.build_mapping(
+                reverse=False,
+                enabled_categories=self.enabled_categories,
+            )
+            self._subtype_index = self._build_subtype_index()
+            self._cache_signature = self._compute_cache_signature()
+            self._selection_cache[key] = (self._mapping, self._subtype_index, self._cache_signature)
+        else:
+            self._mapping, self._subtype_index, self._cache_signature = cached
+        if self._cache_signature != previous_signature:
+            # Entries loaded under another category selection no longer apply.
+            self._scan_cache = None
+
+    def _build_subtype_index(self) -> Dict[str, SubtypeInfo]:
+        """Fold armor membership, categories and mapping into one lookup per subtype."""
+        # Armor flags come straight from the light->heavy table, so the light
+        # and heavy counts need no lookups beyond this index.
+        flags: Dict[str, int] = {}
+        for light, heavy in ArmorBlockReplacer.LIGHT_TO_HEAVY.items():
+            flags[light] = flags.get(light, 0) | _LIGHT_FLAG
+            flags[heavy] = flags.get(heavy, 0) | _HEAVY_FLAG
+
+        categories: Dict[str, List[str]] = {}
+        for category in self._categories:
+            for subtype in category.pairs:
+                categories.setdefault(subtype, []).append(category.name)
+
+        index: Dict[str, SubtypeInfo] = {}
+        for subtype in flags.keys() | categories.keys() | self._mapping.keys():
+            index[subtype] = (
+                flags.get(subtype, 0),
+                tuple(categories.get(subtype, ())),
+                f"{subtype}->{self._mapping[subtype]}" if subtype in self._mapping else None,
+            )
+        return index
+
+    def _compute_cache_signature(self) -> str:
+        """Fingerprint of everything besides bp.sbc itself that shapes a scan result."""
+        payload = [_SCAN_CACHE_VERSION, sorted(self._subtype_index.items())]
+        return hashlib.sha1(fast_json.dumps(payload)).hexdigest()
+
+    def _load_scan_cache(self) -> Dict[str, Dict]:
+        if self._scan_cache is not None:
+            return self._scan_cache
+        entries: Dict[str, Dict] = {}
+        if self.cache_path and self.cache_path.exists():
+            try:
+                data = fast_json.loads(self.cache_path.read_bytes())
+                if data.get("signature") == self._cache_signature:
+                    entries = data.get("entries", {})
+            except (OSError, ValueError, AttributeError):
+                entries = {}
+        self._scan_cache = entries
+        return entries
+
+    def _save_scan_cache(self) -> None:
+        if not self.cache_path or self._scan_cache is None:
+            return
+        payload = {"signature": self._cache_signature, "entries": self._scan_cache}
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            tmp_path.write_bytes(fast_json.dumps(payload))
+            os.replace(tmp_path, self.cache_path)
+        except OSError as exc:
+            print(f"Warning: Could not write scan cache: {exc}")
 
     def get_default_blueprint_path(self) -> Path:
         appdata = os.getenv("APPDATA")
@@ -89,86 +220,133 @@ class BlueprintScanner:
             raise RuntimeError("Could not find APPDATA directory")
         return Path(appdata) / "SpaceEngineers" / "Blueprints" / "workshop"
 
-    def scan_blueprints(self, blueprint_dir: Optional[Path] = None) -> List[BlueprintInfo]:
+    def scan_blueprints(
+        self,
+        blueprint_dir: Optional[Path] = None,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[BlueprintInfo]:
+        """
+        Scan every blueprint folder in blueprint_dir (default: the game's folder).
+
+        progress, if given, is called as progress(done, total) after the folder
+        listing and again as each cache miss is parsed, from the calling thread.
+        """
         if blueprint_dir is None:
             blueprint_dir = self.get_default_blueprint_path()
         blueprint_dir = Path(blueprint_dir)
         if not blueprint_dir.exists():
             raise FileNotFoundError(f"Blueprint directory not found: {blueprint_dir}")
 
-        blueprints: List[BlueprintInfo] = []
-        for item in blueprint_dir.iterdir():
-            if not item.is_dir():
-                continue
-            bp_file = item / "bp.sbc"
-            if not bp_file.exists():
+        cache = self._load_scan_cache() if self.cache_path else {}
+        cache_dirty = False
+        seen: set = set()
+        slots: List[Optional[BlueprintInfo]] = []
+        pending: List[Tuple[int, Path, Path, os.stat_result]] = []
+        # scandir answers is_dir() from the directory listing itself, leaving one
+        # stat of bp.sbc per folder (which also feeds the cache check).
+        with os.scandir(blueprint_dir) as entries:
+            for dir_entry in entries:
+                try:
+                    if not dir_entry.is_dir():
+                        continue
+                except OSError:
+                    continue
+                key = os.path.join(dir_entry.path, "bp.sbc")
+                try:
+                    stat = os.stat(key)
+                except OSError:
+                    continue
+                seen.add(key)
+                entry = cache.get(key)
+                if entry and entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+                    try:
+                        slots.append(BlueprintInfo.from_dict(entry["info"]))
+                        continue
+                    except (KeyError, TypeError, ValueError):
+                        pass
+                item = Path(dir_entry.path)
+                pending.append((len(slots), item, item / "bp.sbc", stat))
+                slots.append(None)
+
+        results = self._parse_pending([(item, bp_file) for _, item, bp_file, _ in pending])
+        if progress is not None:
+            results = self._report_progress(results, len(slots) - len(pending), len(slots), progress)
+        for (slot, item, bp_file, stat), result in zip(pending, results):
+            if not isinstance(result, BlueprintInfo):
+                print(f"Warning: Could not parse {item.name}: {result}")
                 continue
-            try:
-                blueprints.append(self._parse_blueprint(item, bp_file))
-            except Exception as exc:
-                print(f"Warning: Could not parse {item.name}: {exc}")
+            slots[slot] = result
+            if self.cache_path:
+                cache[str(bp_file)] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "info": result.to_dict()}
+                cache_dirty = True
+        blueprints = [info for info in slots if info is not None]
+
+        # Forget blueprints that were deleted from this directory since the last scan.
+        scanned_dir = str(blueprint_dir)
+        for stale in [k for k in cache if k not in seen and os.path.dirname(os.path.dirname(k)) == scanned_dir]:
+            del cache[stale]
+            cache_dirty = True
+        if cache_dirty:
+            self._save_scan_cache()
         self.blueprints_cache = blueprints
         return blueprints
 
-    def _parse_blueprint(self, folder_path: Path, bp_file: Path) -> BlueprintInfo:
-        tree = safe_xml.parse(bp_file)
-        root = tree.getroot()
-
-        display_name = folder_path.name
-        grid_size = "Unknown"
-        grid_size_elem = root.find(".//CubeGrid/GridSizeEnum")
-        if grid_size_elem is not None and grid_size_elem.text:
-            grid_size = grid_size_elem.text.strip()
-
-        blocks = root.findall(".//CubeGrid/CubeBlocks/MyObjectBuilder_CubeBlock")
-        subtype_counter: Dict[str, int] = Counter()
-        category_counter: Dict[str, int] = defaultdict(int)
-        convertible_counter: Dict[str, int] = defaultdict(int)
-
-        light_armor_count = 0
-        heavy_armor_count = 0
-
-        for block in blocks:
-            subtype = self._extract_subtype(block)
-            if not subtype:
-                continue
+    @staticmethod
+    def _report_progress(
+        results: Iterable[Union[BlueprintInfo, str]],
+        done: int,
+        total: int,
+        progress: Callable[[int, int], None],
+    ) -> Iterator[Union[BlueprintInfo, str]]:
+        progress(done, total)
+        for result in results:
+            done += 1
+            progress(done, total)
+            yield result
 
-            subtype_counter[subtype] += 1
-            if subtype in self.LIGHT_ARMOR_BLOCKS:
-                light_armor_count += 1
-            if subtype in self.HEAVY_ARMOR_BLOCKS:
-                heavy_armor_count += 1
-
-            for category in self.registry.list_categories():
-                if subtype in category.pairs:
-                    category_counter[category.name] += 1
-
-            if subtype in self._mapping:
-                target = self._mapping[subtype]
-                convertible_counter[f"{subtype}->{target}"] += 1
-
-        return BlueprintInfo(
-            name=folder_path.name,
-            path=folder_path,
-            display_name=display_name,
-            grid_size=grid_size,
-            block_count=len(blocks),
-            light_armor_count=light_armor_count,
-            heavy_armor_count=heavy_armor_count,
-            has_bp_file=True,
-            subtype_counts=dict(sorted(subtype_counter.items())),
-            category_counts=dict(sorted(category_counter.items())),
-            convertible_counts=dict(sorted(convertible_counter.items())),
-        )
+    def _parse_pending(self, tasks: List[Tuple[Path, Path]]) -> Iterator[Union[BlueprintInfo, str]]:
+        """
+        Parse cache misses lazily, in task order, fanning out to worker
+        processes for large folders.
+        """
+        workers = min(os.cpu_count() or 1, len(tasks))
+        done = 0
+        if len(tasks) >= PARALLEL_SCAN_THRESHOLD and workers > 1:
+            try:
+                # spawn matches Windows everywhere and avoids forking the GUI's threads.
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_scan_worker,
+                    initargs=(self._subtype_index,),
+                ) as pool:
+                    for result in pool.map(_scan_worker, tasks, chunksize=8):
+                        yield result
+                        done += 1
+                return
+            except (OSError, BrokenProcessPool) as exc:
+                print(f"Warning: Parallel scan unavailable, scanning serially: {exc}")
+
+        # After a pool failure, carry on from the first result not yet yielded.
+        for folder_path, bp_file in tasks[done:]:
+            try:
+                yield self._parse_blueprint(folder_path, bp_file)
+            except Exception as exc:
+                yield str(exc)
+
+    def _parse_blueprint(self, folder_path: Path, bp_file: Path) -> BlueprintInfo:
+        return _parse_blueprint_file(folder_path, bp_file, self._subtype_index)
 
     @staticmethod
     def _extract_subtype(block: ET.Element) -> Optional[str]:
+        # Interned so the many repeats of a subtype share one string and the
+        # index/counter lookups short-circuit on identity.
         subtype_name = block.find("SubtypeName")
         if subtype_name is not None and subtype_name.text:
-            return subtype_name.text.strip()
+            return sys.intern(subtype_name.text.strip())
         subtype_id = block.find("SubtypeId")
         if subtype_id is not None and subtype_id.text:
-            return subtype_id.text.strip()
+            return sys.intern(subtype_id.text.strip())
         return None
 
     def get_blueprint_by_name(self, name: str) -> Optional[BlueprintInfo]:
@@ -182,13 +360,103 @@ class BlueprintScanner:
         search_term: str = "",
         min_light_armor: int = 0,
     ) -> List[BlueprintInfo]:
-        filtered = []
+        self._ensure_filter_index()
+        cache = self.blueprints_cache
+        if not search_term:
+            if min_light_armor <= 0:
+                return list(cache)
+            start = bisect.bisect_left(self._light_counts, min_light_armor)
+            return [cache[i] for i in sorted(self._light_order[start:])]
+
         search_lower = search_term.lower()
-        for bp in self.blueprints_cache:
-            if bp.light_armor_count < min_light_armor:
-                continue
-            if search_term and search_lower not in bp.name.lower() and search_lower not in bp.display_name.lower():
-                continue
-            filtered.append(bp)
-        return filtered
+        return [
+            cache[i]
+            for i, (name_lower, display_lower, light_count) in enumerate(self._filter_index)
+            if light_count >= min_light_armor and (search_lower in name_lower or search_lower in display_lower)
+        ]
+
+    def _ensure_filter_index(self) -> None:
+        cache = self.blueprints_cache
+        if self._filter_source is cache and len(self._filter_index) == len(cache):
+            return
+        self._filter_index = [(bp.name.lower(), bp.display_name.lower(), bp.light_armor_count) for bp in cache]
+        self._light_order = sorted(range(len(cache)), key=lambda i: cache[i].light_armor_count)
+        self._light_counts = [cache[i].light_armor_count for i in self._light_order]
+        self._filter_source = cache
+
+
+def _parse_blueprint_file(folder_path: Path, bp_file: Path, index: Dict[str, SubtypeInfo]) -> BlueprintInfo:
+    """Module-level so it can run in scan worker processes."""
+    display_name = folder_path.name
+    grid_size = "Unknown"
+    grid_size_found = False
+    block_count = 0
+    subtype_counter: Dict[str, int] = {}
+    category_counter: Dict[str, int] = {}
+    convertible_counter: Dict[str, int] = {}
+
+    light_armor_count = 0
+    heavy_armor_count = 0
+
+    # safe_xml streams through lxml when it is installed, filtering to the
+    # grid-size and cube-block tags in C instead of walking a full DOM. The
+    # first grid's GridSizeEnum arrives before its blocks and settles the size.
+    for block in safe_xml.iter_grid_elements(bp_file):
+        if block.tag == "GridSizeEnum":
+            if not grid_size_found and block.text:
+                grid_size = block.text.strip()
+                grid_size_found = True
+            continue
+
+        block_count += 1
+        subtype = BlueprintScanner._extract_subtype(block)
+        if subtype:
+            subtype_counter[subtype] = subtype_counter.get(subtype, 0) + 1
+
+    # Classify once per distinct subtype instead of once per block; a large
+    # ship has tens of thousands of blocks but only a few dozen subtypes.
+    for subtype, count in subtype_counter.items():
+        info = index.get(subtype)
+        if info is None:
+            continue
+
+        flags, categories, convertible_key = info
+        if flags & _LIGHT_FLAG:
+            light_armor_count += count
+        if flags & _HEAVY_FLAG:
+            heavy_armor_count += count
+        for name in categories:
+            category_counter[name] = category_counter.get(name, 0) + count
+        if convertible_key is not None:
+            convertible_counter[convertible_key] = convertible_counter.get(convertible_key, 0) + count
+
+    return BlueprintInfo(
+        name=folder_path.name,
+        path=folder_path,
+        display_name=display_name,
+        grid_size=grid_size,
+        block_count=block_count,
+        light_armor_count=light_armor_count,
+        heavy_armor_count=heavy_armor_count,
+        has_bp_file=True,
+        subtype_counts=subtype_counter,
+        category_counts=category_counter,
+        convertible_counts=convertible_counter,
+    )
+
+
+# Subtype index handed to each pool worker once via the initializer.
+_WORKER_INDEX: Dict[str, SubtypeInfo] = {}
+
+
+def _init_scan_worker(index: Dict[str, SubtypeInfo]) -> None:
+    global _WORKER_INDEX
+    _WORKER_INDEX = index
+
 
+def _scan_worker(task: Tuple[Path, Path]) -> Union[BlueprintInfo, str]:
+    folder_path, bp_file = task
+    try:
+        return _parse_blueprint_file(folder_path, bp_file, _WORKER_INDEX)
+    except Exception as exc:
+        return str(exc)
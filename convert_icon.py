@@ -6,6 +6,7 @@ Usage: python convert_icon.py
 """
 
 from PIL import Image
+from io import BytesIO
 import sys
 import os
 
@@ -20,6 +21,17 @@ def find_logo():
     return None
 
 
+def _needs_write(target, source):
+    """True unless target is the source itself or a non-empty file at least as new."""
+    if os.path.exists(target) and os.path.samefile(target, source):
+        return False
+    try:
+        stat = os.stat(target)
+    except OSError:
+        return True
+    return stat.st_size == 0 or stat.st_mtime < os.stat(source).st_mtime
+
+
 def convert_logo_to_ico(input_path=None, output_path="app_icon.ico"):
     if input_path is None:
         input_path = find_logo()
@@ -31,17 +43,33 @@ def convert_logo_to_ico(input_path=None, output_path="app_icon.ico"):
     img = Image.open(input_path).convert("RGBA")
     print(f"Source: {input_path} — {img.size[0]}x{img.size[1]}")
 
-    # Save logo.png (what the GUI header expects)
-    img.save("logo.png", "PNG")
-    print("Saved logo.png")
-
-    # Save app_icon.png (fallback for GUI header)
-    img.save("app_icon.png", "PNG")
-    print("Saved app_icon.png")
+    # Save logo.png (what the GUI header expects) and app_icon.png (fallback
+    # for GUI header), skipping files that are already up to date.
+    # The image is encoded once and the same bytes written to each target.
+    png_bytes = None
+    for png_path in ("logo.png", "app_icon.png"):
+        if not _needs_write(png_path, input_path):
+            print(f"{png_path} is up to date")
+            continue
+        if png_bytes is None:
+            buf = BytesIO()
+            img.save(buf, "PNG", optimize=False)
+            png_bytes = buf.getvalue()
+        with open(png_path, "wb") as f:
+            f.write(png_bytes)
+        print(f"Saved {png_path}")
 
-    # Create multi-size .ico for window icon
+    # Create multi-size .ico for window icon. Each size is thumbnailed once
+    # (keeping the logo's aspect ratio, as the ICO writer would) and the
+    # writer is given the exact frame sizes, so it only encodes frames.
     sizes = [(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    img.save(output_path, format="ICO", sizes=sizes)
+    sizes = [s for s in sizes if s[0] <= img.size[0] and s[1] <= img.size[1]] or [img.size]
+    icons = []
+    for size in sizes:
+        icon = img.copy()
+        icon.thumbnail(size, Image.LANCZOS, reducing_gap=None)
+        icons.append(icon)
+    icons[-1].save(output_path, format="ICO", sizes=[icon.size for icon in icons], append_images=icons[:-1])
     print(f"Saved {output_path} with sizes: {sizes}")
 
 
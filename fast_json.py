@@ -0,0 +1,39 @@
+"""
+Fast JSON helper.
+
+Wraps orjson when available, which parses and serializes several times faster
+than the standard library. Falls back to the stdlib json module when orjson is not
+installed (e.g. minimal CLI installs without requirements.txt).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Union
+
+try:
+    import orjson as _orjson  # type: ignore[import-not-found]
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON bytes or text using orjson."""
+        return _orjson.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes using orjson."""
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0)
+
+    ACCELERATED = True
+except ImportError:  # pragma: no cover - exercised only when orjson absent
+    import json as _json
+
+    def loads(data: Union[bytes, str]) -> Any:
+        """Deserialize JSON bytes or text (stdlib fallback)."""
+        return _json.loads(data)
+
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (stdlib fallback)."""
+        return _json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+    ACCELERATED = False
+
+
+__all__ = ["loads", "dumps", "ACCELERATED"]
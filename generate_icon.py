@@ -1,26 +1,126 @@
 """
 Generate a Meraby Labs branded icon for SE Block Exchanger.
 Creates app_icon.ico with the tactical hologram color scheme.
+Usage: python generate_icon.py [--force]
+
+Build-time tool only: the application never imports it. Pillow is imported
+lazily so an up-to-date check finishes without loading PIL at all.
+
+pillow-simd would speed up the LANCZOS resampling on AVX2 machines, but
+its releases stop at Pillow 9.x and cannot satisfy requirements.txt, so
+plain Pillow is what builds use.
 """
 
-from PIL import Image, ImageDraw, ImageFont
+from functools import lru_cache
+from io import BytesIO
 import os
+import struct
+import sys
 
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
-def generate_icon():
-    """Create a Meraby Labs branded icon matching the tactical hologram theme."""
-    size = 256
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
 
-    # Background: rounded-ish dark gunmetal square
-    bg_color = (15, 23, 42, 255)       # #0f172a  BG_DARK
-    cyan = (6, 182, 212, 255)          # #06b6d4  CYAN_PRIMARY
-    orange = (245, 158, 11, 255)       # #f59e0b  ORANGE_PRIMARY
-    text_cyan = (103, 232, 249, 255)   # #67e8f9  TEXT_CYAN
+@lru_cache(maxsize=4)
+def _resolve_font(candidates):
+    """Return the first candidate font FreeType can open, or None; probed once per chain."""
+    from PIL import ImageFont
+
+    for name in candidates:
+        try:
+            ImageFont.truetype(name, 10)
+        except OSError:
+            continue
+        return name
+    return None
+
+
+@lru_cache(maxsize=8)
+def _load_font(size, candidates=("courbd.ttf", "cour.ttf")):
+    """Load the first available font of the given size, falling back to PIL's default."""
+    from PIL import ImageFont
+
+    path = _resolve_font(candidates)
+    return ImageFont.truetype(path, size) if path else ImageFont.load_default()
+
+
+@lru_cache(maxsize=8)
+def _text_sprite(text, size, color, candidates=("courbd.ttf", "cour.ttf")):
+    """
+    Render text once into a tightly bounded transparent sprite.
+
+    Returns (sprite, (left, top)), where the offset is the ink box position
+    relative to the point draw.text would have been given.
+    """
+    from PIL import Image, ImageDraw
+
+    font = _load_font(size, candidates)
+    left, top, right, bottom = font.getbbox(text)
+    sprite = Image.new('RGBA', (right - left, bottom - top), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).text((-left, -top), text, fill=color, font=font)
+    return sprite, (left, top)
+
+
+def _merge_icos(blobs):
+    """Combine the image directories of several ICO files into a single ICO."""
+    entries, images = [], []
+    for blob in blobs:
+        (count,) = struct.unpack_from('<H', blob, 4)
+        for i in range(count):
+            entry = blob[6 + 16 * i:22 + 16 * i]
+            length, offset = struct.unpack_from('<II', entry, 8)
+            entries.append(entry[:8])
+            images.append(blob[offset:offset + length])
+
+    offset = 6 + 16 * len(entries)
+    out = [struct.pack('<HHH', 0, 1, len(entries))]
+    for entry, data in zip(entries, images):
+        out.append(entry + struct.pack('<II', len(data), offset))
+        offset += len(data)
+    out.extend(images)
+    return b''.join(out)
+
+
+def _is_up_to_date(outputs):
+    """True if every output exists and is at least as new as this script."""
+    try:
+        src_mtime = os.path.getmtime(__file__)
+        return all(os.path.getmtime(path) >= src_mtime for path in outputs)
+    except OSError:
+        return False
+
 
-    # Draw filled background
-    draw.rounded_rectangle([4, 4, size - 5, size - 5], radius=32, fill=bg_color)
+SIZE = 256
+
+# Tactical hologram palette
+BG_COLOR = (15, 23, 42, 255)       # #0f172a  BG_DARK
+CYAN = (6, 182, 212, 255)          # #06b6d4  CYAN_PRIMARY
+ORANGE = (245, 158, 11, 255)       # #f59e0b  ORANGE_PRIMARY
+TEXT_CYAN = (103, 232, 249, 255)   # #67e8f9  TEXT_CYAN
+
+# The sizes Windows actually picks for window, taskbar and Explorer icons.
+ICON_SIZES = [(16, 16), (32, 32), (48, 48), (256, 256)]
+
+
+@lru_cache(maxsize=1)
+def _build_frame():
+    """
+    Rasterize the static background, borders and corner brackets once per process.
+
+    The flat (non-antialiased) artwork is drawn into an 8-bit palette image:
+    index 0 is transparent, then bg, cyan and orange. Callers get the cached
+    RGBA image and must copy it before drawing on it.
+    """
+    from PIL import Image, ImageDraw
+
+    size = SIZE
+    frame = Image.new('P', (size, size), 0)
+    frame.putpalette([0, 0, 0] + [c for color in (BG_COLOR, CYAN, ORANGE) for c in color[:3]])
+    frame.info['transparency'] = 0
+    draw = ImageDraw.Draw(frame)
+    bg, cyan, orange = 1, 2, 3
+
+    # Background: rounded-ish dark gunmetal square
+    draw.rounded_rectangle([4, 4, size - 5, size - 5], radius=32, fill=bg)
 
     # Outer border — cyan
     draw.rounded_rectangle([4, 4, size - 5, size - 5], radius=32, outline=cyan, width=4)
@@ -31,71 +131,86 @@ def generate_icon():
     # Corner brackets (tactical targeting aesthetic)
     blen = 30
     bw = 3
-    # Top-left
-    draw.line([(24, 24), (24 + blen, 24)], fill=cyan, width=bw)
-    draw.line([(24, 24), (24, 24 + blen)], fill=cyan, width=bw)
-    # Top-right
-    draw.line([(size - 25, 24), (size - 25 - blen, 24)], fill=cyan, width=bw)
-    draw.line([(size - 25, 24), (size - 25, 24 + blen)], fill=cyan, width=bw)
-    # Bottom-left
-    draw.line([(24, size - 25), (24 + blen, size - 25)], fill=cyan, width=bw)
-    draw.line([(24, size - 25), (24, size - 25 - blen)], fill=cyan, width=bw)
-    # Bottom-right
-    draw.line([(size - 25, size - 25), (size - 25 - blen, size - 25)], fill=cyan, width=bw)
-    draw.line([(size - 25, size - 25), (size - 25, size - 25 - blen)], fill=cyan, width=bw)
+    near, far = 24, size - 25
+    # One L-shaped polyline per corner: (arm end, corner, arm end)
+    for cx, cy, dx, dy in ((near, near, 1, 1), (far, near, -1, 1), (near, far, 1, -1), (far, far, -1, -1)):
+        draw.line([(cx + dx * blen, cy), (cx, cy), (cx, cy + dy * blen)], fill=cyan, width=bw)
 
-    # Draw "SE" large centered text
-    try:
-        font_large = ImageFont.truetype("courbd.ttf", 88)
-    except OSError:
-        try:
-            font_large = ImageFont.truetype("cour.ttf", 88)
-        except OSError:
-            font_large = ImageFont.load_default()
+    return frame.convert('RGBA')
+
+
+def generate_icon(force=False, sizes=None):
+    """
+    Create a Meraby Labs branded icon matching the tactical hologram theme.
+
+    Does nothing when app_icon.ico and app_icon.png are already newer than
+    this script, unless force is True. sizes overrides ICON_SIZES, e.g. to
+    restore the 24/64/128 px entries.
+    """
+    icon_path = os.path.join(_HERE, 'app_icon.ico')
+    png_path = os.path.join(_HERE, 'app_icon.png')
+    if not force and _is_up_to_date((icon_path, png_path)):
+        print(f"Icon is up to date: {icon_path}")
+        return
+
+    from PIL import Image
 
-    # "SE" in orange
-    bbox = draw.textbbox((0, 0), "SE", font=font_large)
-    tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
-    tx = (size - tw) // 2
+    size = SIZE
+    # Only the text is added per build, each label from a sprite cropped to its
+    # ink box; everything else is the cached frame.
+    img = _build_frame().copy()
+
+    # Draw "SE" large centered text
+    font_large = _load_font(88)
+
+    # "SE" in orange. Labels are centered on their advance width (getlength
+    # skips the full layout that textbbox runs); only "SE" needs its ink
+    # height, which positions both lines vertically.
+    top, bottom = font_large.getbbox("SE")[1::2]
+    tw, th = font_large.getlength("SE"), bottom - top
+    tx = int(size - tw) // 2
     ty = (size - th) // 2 - 24
-    draw.text((tx, ty), "SE", fill=orange, font=font_large)
+    sprite, (dx, dy) = _text_sprite("SE", 88, ORANGE)
+    img.alpha_composite(sprite, (tx + dx, ty + dy))
 
     # Draw "BCX" smaller below
-    try:
-        font_small = ImageFont.truetype("courbd.ttf", 36)
-    except OSError:
-        try:
-            font_small = ImageFont.truetype("cour.ttf", 36)
-        except OSError:
-            font_small = ImageFont.load_default()
+    font_small = _load_font(36)
 
-    bbox2 = draw.textbbox((0, 0), "BCX", font=font_small)
-    tw2 = bbox2[2] - bbox2[0]
-    tx2 = (size - tw2) // 2
+    tw2 = font_small.getlength("BCX")
+    tx2 = int(size - tw2) // 2
     ty2 = ty + th + 8
-    draw.text((tx2, ty2), "BCX", fill=text_cyan, font=font_small)
+    sprite, (dx, dy) = _text_sprite("BCX", 36, TEXT_CYAN)
+    img.alpha_composite(sprite, (tx2 + dx, ty2 + dy))
 
     # "MERABY LABS" tiny at bottom
-    try:
-        font_tiny = ImageFont.truetype("cour.ttf", 16)
-    except OSError:
-        font_tiny = ImageFont.load_default()
+    font_tiny = _load_font(16, ("cour.ttf",))
 
-    bbox3 = draw.textbbox((0, 0), "MERABY LABS", font=font_tiny)
-    tw3 = bbox3[2] - bbox3[0]
-    draw.text(((size - tw3) // 2, size - 42), "MERABY LABS", fill=cyan, font=font_tiny)
+    tw3 = font_tiny.getlength("MERABY LABS")
+    sprite, (dx, dy) = _text_sprite("MERABY LABS", 16, CYAN, ("cour.ttf",))
+    img.alpha_composite(sprite, (int(size - tw3) // 2 + dx, size - 42 + dy))
 
     # Save as multi-size ICO
-    icon_sizes = [(16, 16), (24, 24), (32, 32), (48, 48), (64, 64), (128, 128), (256, 256)]
-    icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app_icon.ico')
-    img.save(icon_path, format='ICO', sizes=icon_sizes)
+    icon_sizes = list(sizes) if sizes else ICON_SIZES
+    # Downsample each size once with LANCZOS; the ICO writer then only encodes.
+    variants = [img.resize(s, Image.Resampling.LANCZOS) for s in icon_sizes if s != img.size]
+    # Small entries are stored as raw 32-bit BMPs (no deflate pass); the 256 px
+    # entry stays PNG-compressed, as Windows expects for that size.
+    parts = []
+    for group, bitmap_format in (([s for s in icon_sizes if s[0] < 256], 'bmp'),
+                                 ([s for s in icon_sizes if s[0] >= 256], 'png')):
+        if group:
+            buf = BytesIO()
+            img.save(buf, format='ICO', sizes=group, append_images=variants, bitmap_format=bitmap_format)
+            parts.append(buf.getvalue())
+    with open(icon_path, 'wb') as f:
+        f.write(_merge_icos(parts))
     print(f"Icon saved to: {icon_path}")
 
     # Also save as PNG for reference
-    png_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'app_icon.png')
-    img.save(png_path, format='PNG')
+    # Fast deflate: this is a build artifact, file size barely matters.
+    img.save(png_path, format='PNG', compress_level=1, optimize=False)
     print(f"PNG preview saved to: {png_path}")
 
 
 if __name__ == '__main__':
-    generate_icon()
+    generate_icon(force='--force' in sys.argv[1:])
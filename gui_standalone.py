@@ -4,9 +4,13 @@ Legacy launcher kept for backward compatibility.
 The v3 UI implementation lives in ui/app.py.
 """
 
+import multiprocessing
+
 from ui.app import main
 
 
 if __name__ == "__main__":
+    # Blueprint scans fan out to worker processes; frozen builds need this.
+    multiprocessing.freeze_support()
     main()
 
@@ -1,17 +1,22 @@
 """
 Safe XML parsing helper.
 
-Wraps defusedxml.ElementTree.parse when available to harden against XXE,
-billion-laughs, and external-DTD attacks. Falls back to xml.etree.ElementTree
+Wraps defusedxml.ElementTree.parse/iterparse when available to harden against
+XXE, billion-laughs, and external-DTD attacks. Falls back to xml.etree.ElementTree
 when defusedxml is not installed (e.g. minimal CLI installs without
 requirements.txt). Only the parse path is hardened — Element construction and
 serialization continue to use the standard library.
+
+When lxml is installed, streaming parses go through lxml.etree.iterparse with
+entity resolution, DTD loading and network access disabled, which is both
+hardened and considerably faster on large blueprints.
 """
 
 from __future__ import annotations
 
+import os
 import xml.etree.ElementTree as ET
-from typing import cast
+from typing import Iterator, List, cast
 
 try:
     import defusedxml.ElementTree as _DET  # type: ignore[import-not-found]
@@ -20,16 +25,103 @@ try:
         """Parse an XML file or file-like object using defusedxml."""
         return cast("ET.ElementTree[ET.Element]", _DET.parse(source))
 
+    def _std_iterparse(source, events=("end",)):
+        return _DET.iterparse(source, events=events)
+
     HARDENED = True
 except ImportError:  # pragma: no cover - exercised only when defusedxml absent
     def parse(source) -> ET.ElementTree[ET.Element]:
         """Parse an XML file or file-like object (stdlib fallback)."""
         return ET.parse(source)
 
+    def _std_iterparse(source, events=("end",)):
+        return ET.iterparse(source, events=events)
+
     HARDENED = False
 
+try:
+    from lxml import etree as _LET  # type: ignore[import-untyped]
+
+    def _lxml_iterparse(source, events=("end",), tag=None):
+        if isinstance(source, os.PathLike):
+            source = os.fspath(source)
+        return _LET.iterparse(
+            source,
+            events=events,
+            tag=tag,
+            resolve_entities=False,
+            load_dtd=False,
+            no_network=True,
+            huge_tree=False,
+        )
+
+    def iterparse(source, events=("end",)):
+        """Incrementally parse an XML file using lxml with entities disabled."""
+        return _lxml_iterparse(source, events=events)
+
+    LXML = True
+except ImportError:  # pragma: no cover - exercised only when lxml absent
+    def iterparse(source, events=("end",)):
+        """Incrementally parse an XML file (defusedxml or stdlib)."""
+        return _std_iterparse(source, events=events)
+
+    LXML = False
+
+
+_GRID_TAGS = ("CubeGrid", "GridSizeEnum", "MyObjectBuilder_CubeBlock")
+
+
+def iter_grid_elements(source) -> Iterator[ET.Element]:
+    """
+    Stream CubeGrid/GridSizeEnum and CubeGrid/CubeBlocks/MyObjectBuilder_CubeBlock
+    elements in document order.
+
+    Each block is cleared and detached from its parent once the consumer asks
+    for the next element, and each finished CubeGrid is emptied, so memory
+    stays flat on large and multi-grid blueprints. Blocks of projected grids
+    nested inside other blocks are not yielded.
+    """
+    if LXML:
+        for _, elem in _lxml_iterparse(source, events=("end",), tag=_GRID_TAGS):
+            if elem.tag == "CubeGrid":
+                elem.clear()
+                continue
+            parent = elem.getparent()
+            if parent is None:
+                continue
+            if elem.tag == "GridSizeEnum":
+                if parent.tag == "CubeGrid":
+                    yield elem
+                continue
+            grid = parent.getparent()
+            if parent.tag != "CubeBlocks" or grid is None or grid.tag != "CubeGrid":
+                continue
+            yield elem
+            elem.clear()
+            parent.remove(elem)
+        return
 
-__all__ = ["parse", "HARDENED"]
+    path: List[str] = []
+    parents: List[ET.Element] = []
+    for event, elem in _std_iterparse(source, events=("start", "end")):
+        if event == "start":
+            path.append(elem.tag)
+            parents.append(elem)
+            continue
+        path.pop()
+        parents.pop()
+        if elem.tag == "CubeGrid":
+            elem.clear()
+            continue
+        if elem.tag == "GridSizeEnum":
+            if path[-1:] == ["CubeGrid"]:
+                yield elem
+            continue
+        if elem.tag != "MyObjectBuilder_CubeBlock" or path[-2:] != ["CubeGrid", "CubeBlocks"]:
+            continue
+        yield elem
+        elem.clear()
+        parents[-1].remove(elem)
 
 
-__all__ = ["parse", "HARDENED"]
+__all__ = ["parse", "iterparse", "iter_grid_elements", "HARDENED", "LXML"]
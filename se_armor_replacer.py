@@ -59,6 +59,18 @@ class ArmorBlockReplacer:
             reverse=self.reverse,
             enabled_categories=self.enabled_categories,
         )
+        # Mappings per direction, so flipping back and forth builds each once.
+        self._mappings: Dict[bool, Dict[str, str]] = {self.reverse: self.mapping}
+
+    def set_reverse(self, reverse: bool) -> None:
+        """Switch conversion direction, keeping registry, profiles and categories."""
+        reverse = bool(reverse)
+        mapping = self._mappings.get(reverse)
+        if mapping is None:
+            mapping = self.registry.build_mapping(reverse=reverse, enabled_categories=self.enabled_categories)
+            self._mappings[reverse] = mapping
+        self.reverse = reverse
+        self.mapping = mapping
 
     def _load_profiles(self) -> None:
         try:
@@ -146,6 +158,7 @@ class ArmorBlockReplacer:
             return 0
         replacements = 0
         self.change_log = []
+        verbose = self.verbose  # checked per block: skip building [MAP] lines when quiet
 
         for cube_blocks in root.findall(".//CubeBlocks"):
             for block in cube_blocks.findall("MyObjectBuilder_CubeBlock"):
@@ -168,7 +181,8 @@ class ArmorBlockReplacer:
 
                 new_subtype = self.mapping[current_subtype]
                 self.change_log.append((current_subtype, new_subtype))
-                self.log(f"[MAP] {current_subtype} -> {new_subtype}")
+                if verbose:
+                    self.log(f"[MAP] {current_subtype} -> {new_subtype}")
 
                 if not dry_run:
                     if subtype_name is not None:
@@ -45,6 +45,21 @@ class TestBlueprintAnalytics(unittest.TestCase):
         self.assertEqual(result.grid_size, "Large")
         self.assertTrue(all(issue.code != "missing_power" for issue in result.health_issues))
 
+    def test_analyze_skips_projected_grid_blocks(self):
+        self._write_blueprint(["LargeBlockArmorBlock"])
+        tree = ET.parse(self.bp_file)
+        projector = ET.SubElement(tree.getroot().find(".//CubeGrid/CubeBlocks"), "MyObjectBuilder_CubeBlock")
+        ET.SubElement(projector, "SubtypeName").text = "LargeProjector"
+        projected = ET.SubElement(ET.SubElement(projector, "ProjectedGrids"), "MyObjectBuilder_CubeGrid")
+        ET.SubElement(projected, "GridSizeEnum").text = "Small"
+        nested = ET.SubElement(ET.SubElement(projected, "CubeBlocks"), "MyObjectBuilder_CubeBlock")
+        ET.SubElement(nested, "SubtypeName").text = "SmallBlockArmorBlock"
+        tree.write(self.bp_file, encoding="utf-8", xml_declaration=True)
+
+        result = self.engine.analyze_blueprint(self.bp_file)
+        self.assertEqual(result.block_counts, {"LargeBlockArmorBlock": 1, "LargeProjector": 1})
+        self.assertEqual(result.grid_size, "Large")
+
     def test_compare_conversion_cost(self):
         self._write_blueprint(["LargeBlockArmorBlock", "LargeBlockArmorBlock", "LargeBlockCockpit"])
         mapping = {"LargeBlockArmorBlock": "LargeHeavyBlockArmorBlock"}
@@ -56,6 +71,18 @@ class TestBlueprintAnalytics(unittest.TestCase):
         self.assertIn("LargeBlockArmorBlock -> LargeHeavyBlockArmorBlock", comparison.block_changes)
         self.assertGreater(comparison.component_delta.get("SteelPlate", 0), 0)
 
+    def test_compare_uses_supplied_analysis(self):
+        self._write_blueprint(["LargeBlockArmorBlock", "LargeBlockCockpit"])
+        mapping = {"LargeBlockArmorBlock": "LargeHeavyBlockArmorBlock"}
+        result = self.engine.analyze_blueprint(self.bp_file)
+        expected = self.engine.compare_conversion_cost(self.bp_file, mapping=mapping, mode="light_to_heavy")
+
+        self.bp_file.unlink()  # any re-read would now fail
+        comparison = self.engine.compare_conversion_cost(
+            self.bp_file, mapping=mapping, mode="light_to_heavy", result=result
+        )
+        self.assertEqual(comparison, expected)
+
     def test_export_reports(self):
         self._write_blueprint(["LargeBlockArmorBlock", "LargeBlockCockpit"])
         comparison = self.engine.compare_conversion_cost(
@@ -70,6 +97,10 @@ class TestBlueprintAnalytics(unittest.TestCase):
         self.assertTrue(csv_path.exists())
         self.assertTrue(txt_path.exists())
 
+    def test_cost_database_shared_between_engines(self):
+        other = BlueprintAnalyticsEngine()
+        self.assertIs(self.engine.db.blocks, other.db.blocks)
+
     def test_apply_fix_add_power(self):
         self._write_blueprint(["LargeBlockArmorBlock", "LargeBlockCockpit"])
         result = self.engine.analyze_blueprint(self.bp_file)
@@ -80,6 +111,45 @@ class TestBlueprintAnalytics(unittest.TestCase):
 
         fixed = self.engine.analyze_blueprint(self.bp_file)
         self.assertFalse(any(issue.code == "missing_power" for issue in fixed.health_issues))
+        self.assertFalse((self.tmp_path / "bp.sbc.tmp").exists())
+
+    def test_apply_fix_multi_grid_targets_first_grid(self):
+        root = ET.Element("Definitions")
+        ship_blueprint = ET.SubElement(ET.SubElement(root, "ShipBlueprints"), "ShipBlueprint")
+        for grid_size in ("Small", "Large"):
+            cube_grid = ET.SubElement(ship_blueprint, "CubeGrid")
+            ET.SubElement(cube_grid, "GridSizeEnum").text = grid_size
+            block = ET.SubElement(ET.SubElement(cube_grid, "CubeBlocks"), "MyObjectBuilder_CubeBlock")
+            ET.SubElement(block, "SubtypeName").text = "LargeBlockArmorBlock"
+        ET.ElementTree(root).write(self.bp_file, encoding="utf-8", xml_declaration=True)
+
+        self.assertTrue(self.engine.apply_fix(self.bp_file, "add_control_block"))
+
+        first_grid = ET.parse(self.bp_file).getroot().find(".//CubeGrid/CubeBlocks")
+        assert first_grid is not None
+        self.assertEqual(
+            [block.findtext("SubtypeName") for block in first_grid],
+            ["LargeBlockArmorBlock", "SmallBlockCockpit"],
+        )
+
+    def test_apply_fix_empty_first_grid_takes_tree_path(self):
+        root = ET.Element("Definitions")
+        ship_blueprint = ET.SubElement(ET.SubElement(root, "ShipBlueprints"), "ShipBlueprint")
+        small = ET.SubElement(ship_blueprint, "CubeGrid")
+        ET.SubElement(small, "GridSizeEnum").text = "Small"
+        ET.SubElement(small, "CubeBlocks")  # serialized as <CubeBlocks />
+        large = ET.SubElement(ship_blueprint, "CubeGrid")
+        ET.SubElement(large, "GridSizeEnum").text = "Large"
+        block = ET.SubElement(ET.SubElement(large, "CubeBlocks"), "MyObjectBuilder_CubeBlock")
+        ET.SubElement(block, "SubtypeName").text = "LargeBlockArmorBlock"
+        ET.ElementTree(root).write(self.bp_file, encoding="utf-8", xml_declaration=True)
+        self.assertIn(b"<CubeBlocks />", self.bp_file.read_bytes())
+
+        self.assertTrue(self.engine.apply_fix(self.bp_file, "add_control_block"))
+
+        grids = ET.parse(self.bp_file).getroot().findall(".//CubeGrid/CubeBlocks")
+        self.assertEqual([block.findtext("SubtypeName") for block in grids[0]], ["SmallBlockCockpit"])
+        self.assertEqual([block.findtext("SubtypeName") for block in grids[1]], ["LargeBlockArmorBlock"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app_settings import AppSettings, SettingsStore
+
+
+class TestSettingsStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "settings.json"
+        self.store = SettingsStore(self.path)
+
+    def tearDown(self):
+        self.store.flush()
+        self.tmp.cleanup()
+
+    def test_save_and_load_round_trip(self):
+        settings = AppSettings(appearance_mode="Dark", enabled_categories=["armor", "thrusters"])
+        self.store.save(settings)
+        loaded = self.store.load()
+        self.assertEqual(loaded.appearance_mode, "Dark")
+        self.assertEqual(loaded.enabled_categories, ["armor", "thrusters"])
+        self.assertFalse(self.path.with_name(self.path.name + ".tmp").exists())
+
+    def test_add_recent_dir_moves_entry_to_front(self):
+        settings = AppSettings(recent_blueprint_dirs=["a", "b", "c"])
+        self.store.add_recent_dir(settings, "c", limit=3)
+        self.assertEqual(settings.recent_blueprint_dirs, ["c", "a", "b"])
+        self.store.add_recent_dir(settings, "d", limit=3)
+        self.assertEqual(settings.recent_blueprint_dirs, ["d", "c", "a"])
+
+    def test_add_recent_drops_every_duplicate(self):
+        settings = AppSettings(recent_blueprint_dirs=["b", "a", "c", "a"], recent_blueprints=["a", "b", "a"])
+        self.store.add_recent_dir(settings, "a")
+        self.assertEqual(settings.recent_blueprint_dirs, ["a", "b", "c"])
+        self.store.add_recent_blueprint(settings, "a")
+        self.assertEqual(settings.recent_blueprints, ["a", "b"])
+
+    def test_add_recent_blueprint_skips_save_when_unchanged(self):
+        settings = AppSettings(recent_blueprints=["Ship"])
+        self.store.add_recent_blueprint(settings, "Ship")
+        self.assertEqual(settings.recent_blueprints, ["Ship"])
+        self.assertFalse(self.path.exists())
+
+    def test_add_recent_saves_are_coalesced_until_flush(self):
+        settings = AppSettings()
+        self.store.add_recent_blueprint(settings, "A")
+        self.store.add_recent_blueprint(settings, "B")
+        self.assertFalse(self.path.exists())
+        self.store.flush()
+        self.assertEqual(self.store.load().recent_blueprints, ["B", "A"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import blueprint_scanner
+from blueprint_scanner import BlueprintScanner
+
+
+class TestBlueprintScanner(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.bp_dir = self.root / "Blueprints"
+        self.bp_dir.mkdir()
+        self.cache_path = self.root / "scan_cache.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_blueprint(self, name, subtypes, grid_size="Large"):
+        folder = self.bp_dir / name
+        folder.mkdir(exist_ok=True)
+        root = ET.Element("Definitions")
+        cube_grid = ET.SubElement(ET.SubElement(ET.SubElement(root, "ShipBlueprints"), "ShipBlueprint"), "CubeGrid")
+        ET.SubElement(cube_grid, "GridSizeEnum").text = grid_size
+        cube_blocks = ET.SubElement(cube_grid, "CubeBlocks")
+        for subtype in subtypes:
+            block = ET.SubElement(cube_blocks, "MyObjectBuilder_CubeBlock")
+            ET.SubElement(block, "SubtypeName").text = subtype
+        bp_file = folder / "bp.sbc"
+        ET.ElementTree(root).write(bp_file, encoding="utf-8", xml_declaration=True)
+        return bp_file
+
+    def test_scan_counts_armor_and_conversions(self):
+        self._write_blueprint("Ship", ["LargeBlockArmorBlock", "LargeBlockArmorBlock", "LargeHeavyBlockArmorBlock"])
+        (info,) = BlueprintScanner().scan_blueprints(self.bp_dir)
+        self.assertEqual(info.block_count, 3)
+        self.assertEqual(info.grid_size, "Large")
+        self.assertEqual(info.light_armor_count, 2)
+        self.assertEqual(info.heavy_armor_count, 1)
+        self.assertEqual(info.convertible_counts, {"LargeBlockArmorBlock->LargeHeavyBlockArmorBlock": 2})
+
+    def test_grid_size_taken_from_first_grid(self):
+        bp_file = self._write_blueprint("Ship", ["SmallBlockArmorBlock"], grid_size="Small")
+        tree = ET.parse(bp_file)
+        second = ET.SubElement(tree.getroot().find("ShipBlueprints/ShipBlueprint"), "CubeGrid")
+        ET.SubElement(second, "GridSizeEnum").text = "Large"
+        block = ET.SubElement(ET.SubElement(second, "CubeBlocks"), "MyObjectBuilder_CubeBlock")
+        ET.SubElement(block, "SubtypeName").text = "LargeBlockArmorBlock"
+        tree.write(bp_file, encoding="utf-8", xml_declaration=True)
+
+        (info,) = BlueprintScanner().scan_blueprints(self.bp_dir)
+        self.assertEqual(info.grid_size, "Small")
+        self.assertEqual(info.block_count, 2)
+
+    def test_scan_cache_reused_until_file_changes(self):
+        bp_file = self._write_blueprint("Ship", ["LargeBlockArmorBlock"])
+        first = BlueprintScanner(cache_path=self.cache_path).scan_blueprints(self.bp_dir)
+        self.assertTrue(self.cache_path.exists())
+
+        scanner = BlueprintScanner(cache_path=self.cache_path)
+        scanner._parse_blueprint = None  # any reparse would now fail loudly
+        cached = scanner.scan_blueprints(self.bp_dir)
+        self.assertEqual([bp.to_dict() for bp in cached], [bp.to_dict() for bp in first])
+
+        self._write_blueprint("Ship", ["LargeBlockArmorBlock", "LargeBlockArmorBlock"])
+        stat = bp_file.stat()
+        os.utime(bp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        (rescanned,) = BlueprintScanner(cache_path=self.cache_path).scan_blueprints(self.bp_dir)
+        self.assertEqual(rescanned.block_count, 2)
+
+    def test_scan_reports_progress(self):
+        self._write_blueprint("Alpha", ["LargeBlockArmorBlock"])
+        self._write_blueprint("Beta", ["LargeBlockArmorBlock"])
+        scanner = BlueprintScanner(cache_path=self.cache_path)
+        scanner.scan_blueprints(self.bp_dir)
+
+        self._write_blueprint("Gamma", ["LargeBlockArmorBlock"])
+        calls = []
+        scanner.scan_blueprints(self.bp_dir, progress=lambda done, total: calls.append((done, total)))
+        self.assertEqual(calls, [(2, 3), (3, 3)])
+
+    def test_filter_blueprints(self):
+        self._write_blueprint("Alpha", ["LargeBlockArmorBlock"] * 3)
+        self._write_blueprint("Beta", ["LargeBlockArmorBlock"])
+        self._write_blueprint("Gamma", ["LargeBlockCockpit"])
+        scanner = BlueprintScanner()
+        order = [bp.name for bp in scanner.scan_blueprints(self.bp_dir)]
+
+        def names(**kwargs):
+            return [bp.name for bp in scanner.filter_blueprints(**kwargs)]
+
+        self.assertEqual(names(), order)
+        self.assertEqual(names(min_light_armor=1), [n for n in order if n != "Gamma"])
+        self.assertEqual(names(min_light_armor=2), ["Alpha"])
+        self.assertEqual(names(search_term="A", min_light_armor=1), [n for n in order if n != "Gamma"])
+        self.assertEqual(names(search_term="gam"), ["Gamma"])
+
+    def test_category_change_reuses_index_and_drops_stale_cache(self):
+        self._write_blueprint("Ship", ["LargeBlockArmorBlock"])
+        scanner = BlueprintScanner(enabled_categories=["armor"], cache_path=self.cache_path)
+        armor_index = scanner._subtype_index
+        (info,) = scanner.scan_blueprints(self.bp_dir)
+        self.assertEqual(info.convertible_counts, {"LargeBlockArmorBlock->LargeHeavyBlockArmorBlock": 1})
+
+        scanner.set_enabled_categories(["thrusters"])
+        (info,) = scanner.scan_blueprints(self.bp_dir)
+        self.assertEqual(info.convertible_counts, {})
+
+        scanner.set_enabled_categories(["armor"])
+        self.assertIs(scanner._subtype_index, armor_index)
+
+    def test_parallel_scan_matches_serial(self):
+        for i in range(blueprint_scanner.PARALLEL_SCAN_THRESHOLD):
+            self._write_blueprint(f"Ship{i:02d}", ["LargeBlockArmorBlock"] * (i + 1))
+        # Force two workers so single-CPU runners still take the process pool path.
+        with mock.patch("os.cpu_count", return_value=2), mock.patch.object(
+            blueprint_scanner, "ProcessPoolExecutor", wraps=blueprint_scanner.ProcessPoolExecutor
+        ) as pool_cls:
+            scanner = BlueprintScanner()
+            scanner._parse_blueprint = None  # a serial fallback would drop every blueprint
+            parallel = scanner.scan_blueprints(self.bp_dir)
+        pool_cls.assert_called_once()
+
+        original = blueprint_scanner.PARALLEL_SCAN_THRESHOLD
+        blueprint_scanner.PARALLEL_SCAN_THRESHOLD = 10**6
+        try:
+            serial = BlueprintScanner().scan_blueprints(self.bp_dir)
+        finally:
+            blueprint_scanner.PARALLEL_SCAN_THRESHOLD = original
+        self.assertEqual([bp.to_dict() for bp in parallel], [bp.to_dict() for bp in serial])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,6 +73,41 @@ class TestNewCommunityFeatures(unittest.TestCase):
         self.assertIn("SmallBlockArmorBlock", subtypes)
         self.assertIn("SmallBlockSmallThrustSciFi", subtypes)
 
+    def test_convert_without_convertible_blocks_creates_nothing(self):
+        bp_dir = self._create_blueprint_dir("Large", ["LargeHeavyBlockArmorBlock", "LargeBlockCockpit"])
+        with self.assertRaises(ValueError):
+            self.converter.create_converted_blueprint(bp_dir)
+        self.assertFalse(self.converter.get_destination_path(bp_dir).exists())
+
+    def test_convert_copies_assets_and_leaves_source_untouched(self):
+        bp_dir = self._create_blueprint_dir("Large", ["LargeBlockArmorBlock"])
+        (bp_dir / "thumb.png").write_bytes(b"png")
+        (bp_dir / "bp.sbcB5").write_bytes(b"stale")
+        original = (bp_dir / "bp.sbc").read_bytes()
+
+        dest_dir, _, converted = self.converter.create_converted_blueprint(bp_dir)
+
+        self.assertEqual(converted, 1)
+        self.assertEqual((dest_dir / "thumb.png").read_bytes(), b"png")
+        self.assertFalse((dest_dir / "bp.sbcB5").exists())
+        self.assertIn(b"LargeHeavyBlockArmorBlock", (dest_dir / "bp.sbc").read_bytes())
+        self.assertEqual((bp_dir / "bp.sbc").read_bytes(), original)
+
+    def test_set_reverse_switches_direction_and_prefix(self):
+        forward_mapping = self.converter.replacer.mapping
+        self.converter.set_reverse(True)
+        self.assertEqual(self.converter.prefix, BlueprintConverter.LIGHTARMOR_PREFIX)
+        self.assertEqual(self.converter.replacer.mapping["LargeHeavyBlockArmorBlock"], "LargeBlockArmorBlock")
+
+        bp_dir = self._create_blueprint_dir("Large", ["LargeHeavyBlockArmorBlock"])
+        dest_dir, _, converted = self.converter.create_converted_blueprint(bp_dir)
+        self.assertEqual(converted, 1)
+        self.assertTrue(dest_dir.name.startswith(BlueprintConverter.LIGHTARMOR_PREFIX))
+
+        self.converter.set_reverse(False)
+        self.assertIs(self.converter.replacer.mapping, forward_mapping)
+        self.assertEqual(self.converter.prefix, BlueprintConverter.HEAVYARMOR_PREFIX)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,8 +9,9 @@ import os
 import sys
 import threading
 import webbrowser
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
@@ -35,6 +36,22 @@ from update_checker import UpdateChecker, UpdateInfo
 from version import __version__
 
 
+# Scans run one at a time on a single reused worker.
+_SCAN_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="blueprint-scan")
+
+
+class ConversionMeta(NamedTuple):
+    label: str  # shown in the confirmation dialog
+    reverse: bool
+    count_attr: str  # BlueprintInfo field holding the source armor count
+
+
+CONVERSION_META = {
+    "light_to_heavy": ConversionMeta(label="forward", reverse=False, count_attr="light_armor_count"),
+    "heavy_to_light": ConversionMeta(label="reverse", reverse=True, count_attr="heavy_armor_count"),
+}
+
+
 def get_resource_path(relative_path: str) -> str:
     base = getattr(sys, "_MEIPASS", os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     return os.path.join(base, relative_path)
@@ -43,6 +60,8 @@ def get_resource_path(relative_path: str) -> str:
 class TacticalCommandCenter(ctk.CTk):
     """Main application window with tactical hologram interface."""
 
+    SELECT_DEBOUNCE_MS = 90
+
     def __init__(self):
         self.settings_store = SettingsStore()
         self.settings: AppSettings = self.settings_store.load()
@@ -63,7 +82,11 @@ class TacticalCommandCenter(ctk.CTk):
         self.enabled_categories = self._resolve_enabled_categories(self.settings.enabled_categories)
         self.conversion_mode = "light_to_heavy"
 
-        self.scanner = BlueprintScanner(registry=self.registry, enabled_categories=self.enabled_categories)
+        self.scanner = BlueprintScanner(
+            registry=self.registry,
+            enabled_categories=self.enabled_categories,
+            cache_path=self.settings_store.path.with_name("scan_cache.json"),
+        )
         self.converter = self._build_converter()
         self.analytics_engine = BlueprintAnalyticsEngine()
         self.update_checker = UpdateChecker(cache_hours=self.settings.cache_hours)
@@ -78,6 +101,16 @@ class TacticalCommandCenter(ctk.CTk):
         self._latest_comparison = None
         self._latest_update: Optional[UpdateInfo] = None
         self._profile_editor: Optional[ProfileEditorDialog] = None
+        self._scan_future: Optional[Future] = None
+        self._convert_future: Optional[Future] = None
+        # Conversions, fixes and analytics share two long-lived workers; XML
+        # preview reads keep their own reader in PreviewPanel.
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="bp-io")
+        self._rescan_pending = False
+        self._screen_size: Optional[Tuple[int, int]] = None
+        self._select_job: Optional[str] = None
+        # (blueprint, mode) whose intel, XML and analytics are on screen.
+        self._detailed: Optional[Tuple[BlueprintInfo, str]] = None
 
         self._build_ui()
         self.toasts = ToastManager(self)
@@ -85,6 +118,7 @@ class TacticalCommandCenter(ctk.CTk):
         self._bind_shortcuts()
         self._setup_drag_drop()
         self._center_window()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.header.set_blueprint_count(0)
         self.header.set_recent_dirs(self.settings.recent_blueprint_dirs)
@@ -106,7 +140,7 @@ class TacticalCommandCenter(ctk.CTk):
     def _build_converter(self) -> BlueprintConverter:
         return BlueprintConverter(
             verbose=False,
-            reverse=(self.conversion_mode == "heavy_to_light"),
+            reverse=CONVERSION_META[self.conversion_mode].reverse,
             enabled_categories=self.enabled_categories,
             include_profiles=True,
             profile_dir=Path("profiles"),
@@ -127,14 +161,29 @@ class TacticalCommandCenter(ctk.CTk):
         except Exception:
             pass
 
+    def _get_screen_size(self):
+        # Each winfo_* call is a Tcl round trip, and the screen rarely changes.
+        if self._screen_size is None:
+            self._screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+        return self._screen_size
+
     def _center_window(self):
         self.update_idletasks()
         w = self.winfo_width()
         h = self.winfo_height()
-        x = (self.winfo_screenwidth() // 2) - (w // 2)
-        y = (self.winfo_screenheight() // 2) - (h // 2)
+        screen_w, screen_h = self._get_screen_size()
+        x = (screen_w // 2) - (w // 2)
+        y = (screen_h // 2) - (h // 2)
         self.geometry(f"{w}x{h}+{x}+{y}")
 
+    def _on_close(self):
+        # Queued work is dropped; a conversion already running finishes its copy.
+        if sys.version_info >= (3, 9):
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._io_pool.shutdown(wait=False)
+        self.destroy()
+
     def _build_ui(self):
         self.header = Header(
             self,
@@ -232,6 +281,8 @@ class TacticalCommandCenter(ctk.CTk):
 
     def set_appearance_mode(self, mode: str):
         normalized = TacticalTheme.normalize_appearance_mode(mode)
+        if normalized == self.settings.appearance_mode:
+            return
         ctk.set_appearance_mode(normalized)
         self.settings.appearance_mode = normalized
         self.settings_store.save(self.settings)
@@ -254,7 +305,11 @@ class TacticalCommandCenter(ctk.CTk):
         self.registry = build_registry(include_builtin=True)
         self.profile_manager.register_profile_categories(self.registry)
         self.enabled_categories = self._resolve_enabled_categories(self.enabled_categories)
-        self.scanner = BlueprintScanner(registry=self.registry, enabled_categories=self.enabled_categories)
+        self.scanner = BlueprintScanner(
+            registry=self.registry,
+            enabled_categories=self.enabled_categories,
+            cache_path=self.settings_store.path.with_name("scan_cache.json"),
+        )
         self.converter = self._build_converter()
         self.control_panel.set_category_options(self.registry.list_categories(), self.enabled_categories)
         self.settings.enabled_categories = list(self.enabled_categories)
@@ -289,6 +344,7 @@ class TacticalCommandCenter(ctk.CTk):
             except Exception:
                 pass
 
+        # Not on the I/O pool: a slow network check must not hold up a conversion.
         threading.Thread(target=task, daemon=True).start()
 
     def _on_update_checked(self, info: UpdateInfo):
@@ -360,20 +416,35 @@ class TacticalCommandCenter(ctk.CTk):
     # ------------------------------------------------------------------
 
     def load_blueprints_async(self):
+        if self._scan_future is not None and not self._scan_future.done():
+            # Never run scans side by side; the directory or categories may have
+            # changed meanwhile, so scan once more when the current one ends.
+            self._rescan_pending = True
+            return
+        self._rescan_pending = False
         self.footer.set_status("SCANNING BLUEPRINTS...")
 
-        def load_task():
-            try:
-                scan_dir = self.custom_blueprint_dir or None
-                self.blueprints = self.scanner.scan_blueprints(scan_dir)
-                self.after(0, self._on_blueprints_loaded)
-            except FileNotFoundError:
-                self.after(0, self._on_scan_not_found)
-            except Exception as exc:
-                error_message = str(exc)
-                self.after(0, lambda msg=error_message: self._show_error(f"Scan failed: {msg}"))
+        scan_dir = self.custom_blueprint_dir or None
+        self._scan_future = _SCAN_POOL.submit(self.scanner.scan_blueprints, scan_dir, self._report_scan_progress)
+        self._scan_future.add_done_callback(lambda future: self.after(0, self._on_scan_finished, future))
 
-        threading.Thread(target=load_task, daemon=True).start()
+    def _report_scan_progress(self, done: int, total: int):
+        # Runs on the scan worker; hand the update to the Tk thread.
+        self.after(0, self.footer.set_status, f"SCANNING BLUEPRINTS... {done}/{total}")
+
+    def _on_scan_finished(self, future: Future):
+        if self._rescan_pending:
+            self.load_blueprints_async()
+            return
+        try:
+            self.blueprints = future.result()
+        except FileNotFoundError:
+            self._on_scan_not_found()
+            return
+        except Exception as exc:
+            self._show_error(f"Scan failed: {exc}")
+            return
+        self._on_blueprints_loaded()
 
     def _on_blueprints_loaded(self):
         count = len(self.blueprints)
@@ -415,14 +486,32 @@ class TacticalCommandCenter(ctk.CTk):
 
     def on_blueprint_select(self, bp: BlueprintInfo):
         self.selected_blueprint = bp
+        self.control_panel.update_details(bp)
+        self._update_convert_state()
+        self.footer.set_status(f"SELECTED: {bp.display_name}")
+
+        # The settings write, XML read and analytics parse only run once the
+        # selection has been stable for a moment, so clicking through the
+        # list does not pay for every blueprint passed on the way.
+        if self._select_job is not None:
+            self.after_cancel(self._select_job)
+        self._select_job = self.after(self.SELECT_DEBOUNCE_MS, self._load_selected_details)
+
+    def _load_selected_details(self):
+        self._select_job = None
+        bp = self.selected_blueprint
+        if bp is None:
+            return
+        # Re-selecting what is already shown (re-click, recent pick) is a no-op.
+        # The blueprint itself is kept, not its id(), which a rescan could reuse.
+        shown = self._detailed
+        if shown is not None and shown[0] is bp and shown[1] == self.conversion_mode:
+            return
+        self._detailed = (bp, self.conversion_mode)
         self.settings_store.add_recent_blueprint(self.settings, bp.display_name)
         self.blueprint_panel.set_recent_blueprints(self.settings.recent_blueprints)
-
-        self.control_panel.update_details(bp)
         self.preview_panel.update_intel(bp, self.conversion_mode)
         self.preview_panel.load_xml(bp.path / "bp.sbc", f"SOURCE: {bp.name}")
-        self._update_convert_state()
-        self.footer.set_status(f"SELECTED: {bp.display_name}")
         self.refresh_analytics_async()
 
     def _get_selected_blueprint_file(self) -> Optional[str]:
@@ -436,7 +525,12 @@ class TacticalCommandCenter(ctk.CTk):
 
     def set_conversion_mode(self, mode: str):
         self.conversion_mode = mode
-        self.converter = self._build_converter()
+        self._detailed = None
+        if self._convert_future is not None and not self._convert_future.done():
+            # The running task keeps its converter; switch on a fresh one.
+            self.converter = self._build_converter()
+        else:
+            self.converter.set_reverse(CONVERSION_META[mode].reverse)
         self._update_convert_state()
         if self.selected_blueprint:
             self.preview_panel.update_intel(self.selected_blueprint, mode)
@@ -449,10 +543,7 @@ class TacticalCommandCenter(ctk.CTk):
             return
 
         bp = self.selected_blueprint
-        if self.conversion_mode == "light_to_heavy":
-            has_source = bp.light_armor_count > 0
-        else:
-            has_source = bp.heavy_armor_count > 0
+        has_source = getattr(bp, CONVERSION_META[self.conversion_mode].count_attr) > 0
 
         if any(category.lower() != "armor" for category in self.enabled_categories):
             has_source = has_source or any(bp.category_counts.get(name, 0) > 0 for name in self.enabled_categories)
@@ -466,7 +557,7 @@ class TacticalCommandCenter(ctk.CTk):
         if not self.selected_blueprint:
             return
         bp = self.selected_blueprint
-        mode_name = "reverse" if self.conversion_mode == "heavy_to_light" else "forward"
+        mode_name = CONVERSION_META[self.conversion_mode].label
         category_text = ", ".join(self.enabled_categories)
 
         confirm = messagebox.askyesno(
@@ -484,17 +575,21 @@ class TacticalCommandCenter(ctk.CTk):
         self.control_panel.progress.start_indeterminate("Converting blueprint...")
         self.footer.set_status("CONVERTING...")
 
+        converter = self.converter
+
         def task():
             try:
-                dest, scanned, converted = self.converter.create_converted_blueprint(bp.path)
+                dest, scanned, converted = converter.create_converted_blueprint(bp.path)
+                self.preview_panel.prefetch_xml(dest / "bp.sbc")
                 self.after(0, lambda: self._on_conversion_complete(dest, scanned, converted))
             except Exception as exc:
                 error_message = str(exc)
                 self.after(0, lambda msg=error_message: self._on_conversion_error(msg))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._convert_future = self._io_pool.submit(task)
 
     def _on_conversion_complete(self, dest_path: Path, scanned: int, converted: int):
+        self._detailed = None  # the XML tab now shows the new copy
         self.control_panel.progress.stop()
         self._converted_count += converted
         self._undo_stack.append(dest_path)
@@ -547,14 +642,16 @@ class TacticalCommandCenter(ctk.CTk):
         def task():
             try:
                 dest, scanned, converted = dlc_converter.create_converted_blueprint(bp.path)
+                self.preview_panel.prefetch_xml(dest / "bp.sbc")
                 self.after(0, lambda: self._on_vanillafy_complete(dest, scanned, converted))
             except Exception as exc:
                 error_message = str(exc)
                 self.after(0, lambda msg=error_message: self._on_conversion_error(msg))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._io_pool.submit(task)
 
     def _on_vanillafy_complete(self, dest_path: Path, scanned: int, converted: int):
+        self._detailed = None  # the XML tab now shows the new copy
         self.control_panel.progress.stop()
         self._converted_count += converted
         self._undo_stack.append(dest_path)
@@ -595,14 +692,16 @@ class TacticalCommandCenter(ctk.CTk):
         def task():
             try:
                 dest, scanned, converted = self.converter.scale_grid_size(bp.path, suggested_grid)
+                self.preview_panel.prefetch_xml(dest / "bp.sbc")
                 self.after(0, lambda: self._on_scale_complete(dest, scanned, converted, suggested_grid))
             except Exception as exc:
                 error_message = str(exc)
                 self.after(0, lambda msg=error_message: self._on_conversion_error(msg))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._io_pool.submit(task)
 
     def _on_scale_complete(self, dest_path: Path, scanned: int, converted: int, target_grid: str):
+        self._detailed = None  # the XML tab now shows the new copy
         self.control_panel.progress.stop()
         self._converted_count += converted
         self._undo_stack.append(dest_path)
@@ -656,7 +755,7 @@ class TacticalCommandCenter(ctk.CTk):
                 try:
                     converter = BlueprintConverter(
                         verbose=False,
-                        reverse=(self.conversion_mode == "heavy_to_light"),
+                        reverse=CONVERSION_META[self.conversion_mode].reverse,
                         enabled_categories=self.enabled_categories,
                         include_profiles=True,
                         profile_dir=Path("profiles"),
@@ -673,7 +772,7 @@ class TacticalCommandCenter(ctk.CTk):
                 lambda: self._on_batch_complete(total, total_scanned, total_converted, errors, created),
             )
 
-        threading.Thread(target=batch_task, daemon=True).start()
+        self._io_pool.submit(batch_task)
 
     def _on_batch_complete(self, count, scanned, converted, errors, created_paths: List[Path]):
         self.control_panel.progress.stop()
@@ -723,7 +822,7 @@ class TacticalCommandCenter(ctk.CTk):
         try:
             replacer = ArmorBlockReplacer(
                 verbose=False,
-                reverse=(self.conversion_mode == "heavy_to_light"),
+                reverse=CONVERSION_META[self.conversion_mode].reverse,
                 enabled_categories=self.enabled_categories,
                 include_profiles=True,
                 profile_dir=Path("profiles"),
@@ -744,6 +843,7 @@ class TacticalCommandCenter(ctk.CTk):
                 bp_file,
                 replacer.mapping,
                 self.conversion_mode,
+                result=self._latest_analytics,
             )
             self.preview_panel.update_analytics(self._latest_analytics, self._latest_comparison)
         except Exception as exc:
@@ -758,7 +858,7 @@ class TacticalCommandCenter(ctk.CTk):
             try:
                 replacer = ArmorBlockReplacer(
                     verbose=False,
-                    reverse=(self.conversion_mode == "heavy_to_light"),
+                    reverse=CONVERSION_META[self.conversion_mode].reverse,
                     enabled_categories=self.enabled_categories,
                     include_profiles=True,
                     profile_dir=Path("profiles"),
@@ -768,13 +868,14 @@ class TacticalCommandCenter(ctk.CTk):
                     bp_file,
                     replacer.mapping,
                     self.conversion_mode,
+                    result=analytics,
                 )
                 self.after(0, lambda: self._on_analytics_ready(analytics, comparison))
             except Exception as exc:
                 error_message = str(exc)
                 self.after(0, lambda msg=error_message: self._show_error(f"Analytics failed: {msg}"))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._io_pool.submit(task)
 
     def _on_analytics_ready(self, analytics, comparison):
         self._latest_analytics = analytics
@@ -4,14 +4,23 @@ Left panel with searchable blueprint card list
 """
 
 import customtkinter as ctk
-from typing import List, Optional, Callable
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from ui.theme import TacticalTheme
 from ui.widgets.blueprint_card import BlueprintCard
 
 
+def _trigrams(text: str) -> FrozenSet[str]:
+    return frozenset(text[i:i + 3] for i in range(len(text) - 2))
+
+
 class BlueprintPanel(ctk.CTkFrame):
     """Left panel containing search bar and scrollable blueprint card list."""
 
+    # Typing pauses shorter than this are coalesced into a single filter pass.
+    SEARCH_DEBOUNCE_MS = 150
+    # Cards are built a page at a time; SHOW MORE appends the next page.
+    CARD_PAGE_SIZE = 200
+
     def __init__(
         self,
         master,
@@ -31,8 +40,25 @@ class BlueprintPanel(ctk.CTkFrame):
         self._on_recent_select = on_recent_select
         self._cards: List[BlueprintCard] = []
         self._blueprints = []
+        # Built once per set_blueprints(): lowercased (name, display_name) for
+        # filtering, and each blueprint's card (keyed by id) so filtering
+        # re-packs existing cards instead of constructing new ones.
+        self._search_keys: List[Tuple[str, str]] = []
+        self._trigrams: List[FrozenSet[str]] = []
+        self._card_cache: Dict[int, BlueprintCard] = {}
+        self._empty_label: Optional[ctk.CTkLabel] = None
+        self._more_button: Optional[ctk.CTkButton] = None
+        # The blueprints the cards currently show, in card order.
+        self._visible: List = []
         self._selected_indices: set = set()
         self._recent_lookup = {}
+        self._search_job = None
+        # Normalized search text, or None when the box is empty; set by the
+        # variable trace so filtering never has to read the Tk variable.
+        self._active_query: Optional[str] = None
+        self._search_focused = False
+        # The query the shown cards were filtered with (None: unfiltered).
+        self._applied_query: Optional[str] = None
 
         # Header
         ctk.CTkLabel(
@@ -73,21 +99,34 @@ class BlueprintPanel(ctk.CTkFrame):
         search_frame.pack(fill="x", padx=10, pady=(0, 8))
 
         self.search_var = ctk.StringVar()
-        self.search_var.trace_add("write", lambda *a: self._on_search())
+        self.search_var.trace_add("write", self._on_search_changed)
 
+        # CTkEntry ignores placeholder_text once a textvariable is attached, so
+        # the hint is an overlay label and the variable only ever holds input.
         self._search_entry = ctk.CTkEntry(
             search_frame,
             textvariable=self.search_var,
-            placeholder_text="SEARCH BLUEPRINTS...",
             font=TacticalTheme.FONT_NORMAL,
             text_color=TacticalTheme.TEXT_CYAN,
             fg_color=TacticalTheme.BG_DARK,
             border_color=TacticalTheme.CYAN_DIM,
-            placeholder_text_color=TacticalTheme.TEXT_GRAY,
             height=32,
         )
         self._search_entry.pack(fill="x")
 
+        self._search_hint = ctk.CTkLabel(
+            self._search_entry,
+            text="SEARCH BLUEPRINTS...",
+            font=TacticalTheme.FONT_NORMAL,
+            text_color=TacticalTheme.TEXT_GRAY,
+            fg_color=TacticalTheme.BG_DARK,
+            height=20,
+        )
+        self._search_hint.bind("<Button-1>", lambda e: self._search_entry.focus_set())
+        self._search_entry.bind("<FocusIn>", lambda e: self._set_search_focus(True))
+        self._search_entry.bind("<FocusOut>", lambda e: self._set_search_focus(False))
+        self._update_search_hint()
+
         # Scrollable card container
         self._scroll_frame = ctk.CTkScrollableFrame(
             self,
@@ -100,36 +139,88 @@ class BlueprintPanel(ctk.CTkFrame):
 
     def set_blueprints(self, blueprints):
         """Populate the card list with blueprint data."""
+        for card in self._card_cache.values():
+            card.destroy()
+        self._card_cache.clear()
+        self._cards.clear()
         self._blueprints = blueprints
+        self._search_keys = [(bp.name.lower(), bp.display_name.lower()) for bp in blueprints]
+        self._trigrams = [_trigrams(f"{name}\0{display}") for name, display in self._search_keys]
         self._selected_indices.clear()
+        self._applied_query = None
         self._rebuild_cards(blueprints)
 
     def _rebuild_cards(self, blueprints):
-        """Rebuild all card widgets."""
-        # Clear existing cards
+        """Show cards for the given blueprints, creating only the missing ones."""
+        self._visible = list(blueprints)
+        page = self._visible[:self.CARD_PAGE_SIZE]
+        # Packed cards that already appear in the new page in the same order
+        # stay put (a narrowing filter keeps most of them); only the rest are
+        # unpacked, and _append_cards packs the missing tail.
+        kept: List[BlueprintCard] = []
         for card in self._cards:
-            card.destroy()
-        self._cards.clear()
+            if len(kept) < len(page) and card.bp_info is page[len(kept)]:
+                card.index = len(kept)
+                card.set_selected(False)
+                kept.append(card)
+            else:
+                card.pack_forget()
+        self._cards = kept
 
         if not blueprints:
-            ctk.CTkLabel(
-                self._scroll_frame,
-                text="NO BLUEPRINTS FOUND",
-                font=TacticalTheme.FONT_NORMAL,
-                text_color=TacticalTheme.TEXT_GRAY,
-            ).pack(pady=20)
+            if self._more_button is not None:
+                self._more_button.pack_forget()
+            if self._empty_label is None:
+                self._empty_label = ctk.CTkLabel(
+                    self._scroll_frame,
+                    text="NO BLUEPRINTS FOUND",
+                    font=TacticalTheme.FONT_NORMAL,
+                    text_color=TacticalTheme.TEXT_GRAY,
+                )
+            self._empty_label.pack(pady=20)
             return
+        if self._empty_label is not None:
+            self._empty_label.pack_forget()
+
+        self._append_cards(len(page) - len(kept))
 
-        for i, bp in enumerate(blueprints):
-            card = BlueprintCard(
-                self._scroll_frame, bp, i,
-                on_select=self._handle_card_select,
-            )
+    def _append_cards(self, count: int):
+        """Pack cards for the next count visible blueprints after the shown ones."""
+        start = len(self._cards)
+        if self._more_button is not None:
+            self._more_button.pack_forget()
+        for i, bp in enumerate(self._visible[start:start + count], start):
+            card = self._card_cache.get(id(bp))
+            if card is None:
+                card = BlueprintCard(
+                    self._scroll_frame, bp, i,
+                    on_select=self._handle_card_select,
+                )
+                self._card_cache[id(bp)] = card
+            else:
+                card.index = i
+                card.set_selected(False)
             card.pack(fill="x", padx=4, pady=2)
             self._cards.append(card)
 
+        remaining = len(self._visible) - len(self._cards)
+        if remaining > 0:
+            if self._more_button is None:
+                self._more_button = ctk.CTkButton(
+                    self._scroll_frame,
+                    font=TacticalTheme.FONT_SMALL,
+                    fg_color=TacticalTheme.BG_GLASS,
+                    text_color=TacticalTheme.TEXT_CYAN,
+                    hover_color=TacticalTheme.CYAN_DIM,
+                    height=28,
+                    command=lambda: self._append_cards(self.CARD_PAGE_SIZE),
+                )
+            self._more_button.configure(text=f"SHOW MORE ({remaining} REMAINING)")
+            self._more_button.pack(fill="x", padx=4, pady=6)
+
     def _handle_card_select(self, index: int, multi: bool = False):
         """Handle card selection, supporting multi-select with Ctrl."""
+        previous = set(self._selected_indices)
         if multi:
             if index in self._selected_indices:
                 self._selected_indices.discard(index)
@@ -138,43 +229,92 @@ class BlueprintPanel(ctk.CTkFrame):
         else:
             self._selected_indices = {index}
 
-        # Update card visuals
-        for i, card in enumerate(self._cards):
-            card.set_selected(i in self._selected_indices)
+        # Restyle only the cards whose state flipped; every configure() redraws
+        # the card's canvas, so touching all cards made each click O(N).
+        for i in previous ^ self._selected_indices:
+            if i < len(self._cards):
+                self._cards[i].set_selected(i in self._selected_indices)
 
-        # Notify parent of primary selection (last clicked)
-        visible = self._get_visible_blueprints()
-        if index < len(visible) and self._on_select:
-            self._on_select(visible[index])
+        # Notify parent of primary selection (last clicked). The card carries its
+        # blueprint, so this stays right while a debounced search is pending.
+        if index < len(self._cards) and self._on_select:
+            self._on_select(self._cards[index].bp_info)
+
+    def _set_search_focus(self, focused: bool):
+        self._search_focused = focused
+        self._update_search_hint()
+
+    def _update_search_hint(self):
+        if self._active_query is None and not self._search_focused:
+            self._search_hint.place(x=8, rely=0.5, anchor="w")
+        else:
+            self._search_hint.place_forget()
+
+    def _on_search_changed(self, *_):
+        self._active_query = self.search_var.get().strip().lower() or None
+        self._update_search_hint()
+        self._schedule_search()
+
+    def _schedule_search(self):
+        """Restart the debounce timer; the filter runs once typing pauses."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+        self._search_job = self.after(self.SEARCH_DEBOUNCE_MS, self._run_scheduled_search)
+
+    def _run_scheduled_search(self):
+        self._search_job = None
+        self._on_search()
+
+    def _flush_search(self):
+        """Apply a pending debounced search immediately."""
+        if self._search_job is not None:
+            self.after_cancel(self._search_job)
+            self._run_scheduled_search()
 
     def _on_search(self):
         """Filter cards based on search text."""
-        search = self.search_var.get().lower()
-        if not search:
-            self._rebuild_cards(self._blueprints)
+        query = self._active_query
+        if query == self._applied_query:
             return
-
-        filtered = [
-            bp for bp in self._blueprints
-            if search in bp.name.lower() or search in bp.display_name.lower()
-        ]
+        self._applied_query = query
+        if query is None:
+            # Clearing the box while every blueprint is already shown.
+            if self._showing_full():
+                return
+            results = self._blueprints
+        else:
+            results = self._filter(query)
+        # Typing often leaves the result set as it was (e.g. one more letter of
+        # an already unique name); the shown cards and selection stay valid.
+        if len(results) == len(self._visible) and (
+            self._showing_full() or all(a is b for a, b in zip(results, self._visible))
+        ):
+            return
+        # Fresh cards start unselected, so the selection must be reset too.
         self._selected_indices.clear()
-        self._rebuild_cards(filtered)
+        self._rebuild_cards(results)
+
+    def _showing_full(self) -> bool:
+        # Shown cards are always an ordered subset of _blueprints, so equal
+        # length means the full list; no flag to keep in sync with reloads.
+        return len(self._visible) == len(self._blueprints)
+
+    def _filter(self, search: str):
+        rows: Iterable[Tuple[Any, Tuple[str, str]]] = zip(self._blueprints, self._search_keys)
+        if len(search) >= 3:
+            # A blueprint can only match if it has every trigram of the query,
+            # which rejects most rows with one set comparison.
+            wanted = _trigrams(search)
+            rows = (row for row, grams in zip(rows, self._trigrams) if wanted <= grams)
+        return [bp for bp, (name, display) in rows if search in name or search in display]
 
     def _get_visible_blueprints(self):
         """Return the currently visible (possibly filtered) blueprints."""
-        search = self.search_var.get().lower()
-        if not search:
-            return self._blueprints
-        return [
-            bp for bp in self._blueprints
-            if search in bp.name.lower() or search in bp.display_name.lower()
-        ]
+        return self._visible
 
     def get_selected_blueprints(self):
         """Return list of currently selected blueprint infos."""
-        visible = self._get_visible_blueprints()
-        return [visible[i] for i in sorted(self._selected_indices) if i < len(visible)]
+        return [self._cards[i].bp_info for i in sorted(self._selected_indices) if i < len(self._cards)]
 
     def get_selected_count(self) -> int:
         return len(self._selected_indices)
@@ -200,9 +340,12 @@ class BlueprintPanel(ctk.CTkFrame):
             self._on_recent_select(name)
 
     def select_blueprint_by_name(self, name: str) -> bool:
+        self._flush_search()
         visible = self._get_visible_blueprints()
         for idx, bp in enumerate(visible):
             if bp.display_name == name or bp.name == name:
+                if idx >= len(self._cards):
+                    self._append_cards(idx + 1 - len(self._cards))
                 self._handle_card_select(idx, multi=False)
                 return True
         return False
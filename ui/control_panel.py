@@ -12,6 +12,45 @@ from se_armor_replacer import ArmorBlockReplacer
 class ControlPanel(ctk.CTkFrame):
     """Right panel with details, exchange visualization, and conversion controls."""
 
+    # Button options applied when switching to each conversion mode.
+    _MODE_STYLES = {
+        "light_to_heavy": (
+            ("mode_lth_btn", dict(
+                fg_color=TacticalTheme.ORANGE_PRIMARY,
+                text_color=TacticalTheme.BG_DARK,
+                border_width=0,
+            )),
+            ("mode_htl_btn", dict(
+                fg_color=TacticalTheme.BG_DARK,
+                text_color=TacticalTheme.CYAN_PRIMARY,
+                border_width=1,
+            )),
+            ("convert_btn", dict(
+                text="CONVERT TO HEAVY",
+                text_color=TacticalTheme.ORANGE_PRIMARY,
+                border_color=TacticalTheme.ORANGE_PRIMARY,
+            )),
+        ),
+        "heavy_to_light": (
+            ("mode_lth_btn", dict(
+                fg_color=TacticalTheme.BG_DARK,
+                text_color=TacticalTheme.CYAN_PRIMARY,
+                border_width=1,
+                border_color=TacticalTheme.CYAN_DIM,
+            )),
+            ("mode_htl_btn", dict(
+                fg_color=TacticalTheme.CYAN_PRIMARY,
+                text_color=TacticalTheme.BG_DARK,
+                border_width=0,
+            )),
+            ("convert_btn", dict(
+                text="CONVERT TO LIGHT",
+                text_color=TacticalTheme.CYAN_PRIMARY,
+                border_color=TacticalTheme.CYAN_PRIMARY,
+            )),
+        ),
+    }
+
     def __init__(
         self,
         master,
@@ -36,6 +75,7 @@ class ControlPanel(ctk.CTkFrame):
         self._on_categories_change = on_categories_change
         self._on_undo = on_undo
         self._category_vars = {}
+        self._mode = "light_to_heavy"
 
         # Main scrollable container
         container = ctk.CTkScrollableFrame(self, fg_color="transparent")
@@ -60,7 +100,10 @@ class ControlPanel(ctk.CTkFrame):
         info_frame.pack(fill="x", padx=16, pady=(0, 12))
         info_frame.columnconfigure(1, weight=1)
 
+        # Values are bound to StringVars: a set() is one Tcl variable write,
+        # where CTkLabel.configure(text=...) goes through CustomTkinter first.
         self.detail_labels = {}
+        self.detail_vars = {}
         fields = [
             ("NAME:", "name", TacticalTheme.CYAN_PRIMARY),
             ("GRID SIZE:", "grid", TacticalTheme.CYAN_PRIMARY),
@@ -77,14 +120,16 @@ class ControlPanel(ctk.CTkFrame):
                 text_color=TacticalTheme.TEXT_GRAY,
             ).grid(row=i, column=0, sticky="w", padx=(0, 8), pady=2)
 
+            value_var = ctk.StringVar(value="--")
             value_label = ctk.CTkLabel(
-                info_frame, text="--",
+                info_frame, textvariable=value_var,
                 font=TacticalTheme.FONT_NORMAL,
                 text_color=color,
                 anchor="w",
             )
             value_label.grid(row=i, column=1, sticky="ew", pady=2)
             self.detail_labels[key] = value_label
+            self.detail_vars[key] = value_var
 
         # --- EXCHANGE VISUALIZATION ---
         exchange_frame = ctk.CTkFrame(
@@ -115,11 +160,13 @@ class ControlPanel(ctk.CTkFrame):
         ctk.CTkLabel(std_frame, text="STANDARD",
                      font=TacticalTheme.FONT_NORMAL,
                      text_color=TacticalTheme.CYAN_PRIMARY).pack(pady=(6, 2))
-        for txt in ["> LightArmor...", "> Slope", "> Corner", "> Panel"]:
-            ctk.CTkLabel(std_frame, text=txt, font=TacticalTheme.FONT_SMALL,
-                         text_color=TacticalTheme.TEXT_GRAY).pack(pady=0)
+        # One multi-line label per static list rather than a widget per line.
+        ctk.CTkLabel(std_frame, text="\n".join(["> LightArmor...", "> Slope", "> Corner", "> Panel"]),
+                     font=TacticalTheme.FONT_SMALL, justify="center",
+                     text_color=TacticalTheme.TEXT_GRAY).pack(pady=0)
+        self.light_count_var = ctk.StringVar(value="0 BLOCKS")
         self.light_count_label = ctk.CTkLabel(
-            std_frame, text="0 BLOCKS",
+            std_frame, textvariable=self.light_count_var,
             font=TacticalTheme.FONT_NORMAL,
             text_color=TacticalTheme.ORANGE_PRIMARY,
         )
@@ -139,11 +186,12 @@ class ControlPanel(ctk.CTkFrame):
         ctk.CTkLabel(heavy_frame, text="HEAVY",
                      font=TacticalTheme.FONT_NORMAL,
                      text_color=TacticalTheme.ORANGE_PRIMARY).pack(pady=(6, 2))
-        for txt in ["> HeavyArmor...", "> Slope", "> Corner", "> Panel"]:
-            ctk.CTkLabel(heavy_frame, text=txt, font=TacticalTheme.FONT_SMALL,
-                         text_color=TacticalTheme.ORANGE_DIM).pack(pady=0)
+        ctk.CTkLabel(heavy_frame, text="\n".join(["> HeavyArmor...", "> Slope", "> Corner", "> Panel"]),
+                     font=TacticalTheme.FONT_SMALL, justify="center",
+                     text_color=TacticalTheme.ORANGE_DIM).pack(pady=0)
+        self.heavy_count_var = ctk.StringVar(value="0 BLOCKS")
         self.heavy_count_label = ctk.CTkLabel(
-            heavy_frame, text="0 BLOCKS",
+            heavy_frame, textvariable=self.heavy_count_var,
             font=TacticalTheme.FONT_NORMAL,
             text_color=TacticalTheme.ORANGE_PRIMARY,
         )
@@ -226,6 +274,7 @@ class ControlPanel(ctk.CTkFrame):
             command=self._convert,
         )
         self.convert_btn.pack(fill="x", padx=8, pady=(8, 4))
+        self._convert_enabled = False
 
         # --- BATCH BUTTON ---
         self.batch_btn = ctk.CTkButton(
@@ -257,39 +306,11 @@ class ControlPanel(ctk.CTkFrame):
         self.undo_btn.pack(fill="x", padx=8, pady=(0, 8))
 
     def _set_mode(self, mode: str):
-        if mode == "light_to_heavy":
-            self.mode_lth_btn.configure(
-                fg_color=TacticalTheme.ORANGE_PRIMARY,
-                text_color=TacticalTheme.BG_DARK,
-                border_width=0,
-            )
-            self.mode_htl_btn.configure(
-                fg_color=TacticalTheme.BG_DARK,
-                text_color=TacticalTheme.CYAN_PRIMARY,
-                border_width=1,
-            )
-            self.convert_btn.configure(
-                text="CONVERT TO HEAVY",
-                text_color=TacticalTheme.ORANGE_PRIMARY,
-                border_color=TacticalTheme.ORANGE_PRIMARY,
-            )
-        else:
-            self.mode_lth_btn.configure(
-                fg_color=TacticalTheme.BG_DARK,
-                text_color=TacticalTheme.CYAN_PRIMARY,
-                border_width=1,
-                border_color=TacticalTheme.CYAN_DIM,
-            )
-            self.mode_htl_btn.configure(
-                fg_color=TacticalTheme.CYAN_PRIMARY,
-                text_color=TacticalTheme.BG_DARK,
-                border_width=0,
-            )
-            self.convert_btn.configure(
-                text="CONVERT TO LIGHT",
-                text_color=TacticalTheme.CYAN_PRIMARY,
-                border_color=TacticalTheme.CYAN_PRIMARY,
-            )
+        if mode == self._mode:
+            return
+        self._mode = mode
+        for attr, options in self._MODE_STYLES[mode]:
+            getattr(self, attr).configure(**options)
         if self._on_mode_change:
             self._on_mode_change(mode)
 
@@ -307,25 +328,29 @@ class ControlPanel(ctk.CTkFrame):
 
     def update_details(self, bp_info):
         """Update detail labels with blueprint info."""
-        self.detail_labels['name'].configure(text=bp_info.display_name)
-        self.detail_labels['grid'].configure(text=bp_info.grid_size)
-        self.detail_labels['blocks'].configure(text=str(bp_info.block_count))
-        self.detail_labels['light_armor'].configure(text=str(bp_info.light_armor_count))
-        self.detail_labels['heavy_armor'].configure(text=str(bp_info.heavy_armor_count))
-        self.detail_labels['mappings'].configure(text=str(len(ArmorBlockReplacer.LIGHT_TO_HEAVY)))
+        self.detail_vars['name'].set(bp_info.display_name)
+        self.detail_vars['grid'].set(bp_info.grid_size)
+        self.detail_vars['blocks'].set(str(bp_info.block_count))
+        self.detail_vars['light_armor'].set(str(bp_info.light_armor_count))
+        self.detail_vars['heavy_armor'].set(str(bp_info.heavy_armor_count))
+        self.detail_vars['mappings'].set(str(len(ArmorBlockReplacer.LIGHT_TO_HEAVY)))
 
-        self.light_count_label.configure(text=f"{bp_info.light_armor_count} BLOCKS")
-        self.heavy_count_label.configure(text=f"{bp_info.heavy_armor_count} BLOCKS")
+        self.light_count_var.set(f"{bp_info.light_armor_count} BLOCKS")
+        self.heavy_count_var.set(f"{bp_info.heavy_armor_count} BLOCKS")
 
     def clear_details(self):
         """Reset detail labels to defaults."""
-        for key in self.detail_labels:
-            self.detail_labels[key].configure(text="--")
-        self.light_count_label.configure(text="0 BLOCKS")
-        self.heavy_count_label.configure(text="0 BLOCKS")
+        for var in self.detail_vars.values():
+            var.set("--")
+        self.light_count_var.set("0 BLOCKS")
+        self.heavy_count_var.set("0 BLOCKS")
 
     def set_convert_enabled(self, enabled: bool):
         """Enable or disable the convert button."""
+        # Mirrors the button's state so unchanged selections skip the configure.
+        if enabled == self._convert_enabled:
+            return
+        self._convert_enabled = enabled
         self.convert_btn.configure(state="normal" if enabled else "disabled")
 
     def set_category_options(self, categories, enabled_categories):
@@ -5,8 +5,11 @@ Center tabview with Intel, XML Source, Preview Diff, and Analytics tabs.
 
 from __future__ import annotations
 
+import os
 import tkinter as tk
-from typing import Dict, Iterable, List, Optional
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import customtkinter as ctk
 
@@ -20,9 +23,24 @@ from blueprint_analytics import (
 from ui.theme import TacticalTheme
 
 
+# Reads XML sources off the Tk thread; one worker also serializes the cache.
+_XML_READER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xml-preview")
+
+
 class PreviewPanel(ctk.CTkFrame):
     """Center panel with tabbed views for blueprint information."""
 
+    XML_TAB = "XML SOURCE"
+    # Characters inserted into the XML viewer per event-loop turn; a default
+    # preview fits in one.
+    XML_CHUNK_CHARS = 16 * 1024
+    # Bytes shown when a file is selected; SHOW FULL reads the rest on demand.
+    XML_PREVIEW_BYTES = 16 * 1024
+    # Recently viewed files, keyed on (path, mtime_ns, size) so a rewrite
+    # (conversion, applied fix) is never served stale. Huge files are not kept.
+    XML_CACHE_SIZE = 16
+    XML_CACHE_MAX_CHARS = 2 * 1024 * 1024
+
     def __init__(
         self,
         master,
@@ -49,6 +67,13 @@ class PreviewPanel(ctk.CTkFrame):
         self._on_vanillafy = on_vanillafy
         self._on_scale_grid = on_scale_grid
         self._latest_health_issues: List[HealthIssue] = []
+        # (file, status, byte limit) waiting for the XML tab to be shown, and a
+        # counter that stops a chunked insert once a newer file replaces it.
+        self._xml_pending: Optional[Tuple[object, str, Optional[int]]] = None
+        self._xml_load_token = 0
+        self._xml_cache: OrderedDict[Tuple[str, int, int, int], Tuple[str, bool]] = OrderedDict()
+        # The (file, status) currently in the viewer, for SHOW FULL.
+        self._xml_shown: Optional[Tuple[object, str]] = None
 
         self.tabview = ctk.CTkTabview(
             self,
@@ -61,6 +86,7 @@ class PreviewPanel(ctk.CTkFrame):
             text_color=TacticalTheme.TEXT_GRAY,
             text_color_disabled=TacticalTheme.TEXT_GRAY,
             corner_radius=6,
+            command=self._on_tab_changed,
         )
         self.tabview.pack(fill="both", expand=True, padx=4, pady=4)
 
@@ -91,9 +117,13 @@ class PreviewPanel(ctk.CTkFrame):
         self.intel_text.pack(fill="both", expand=True, padx=20, pady=10)
 
     def _build_xml_tab(self):
-        self.tab_xml = self.tabview.add("XML SOURCE")
+        # Only the tab itself; its text widget is built on first view.
+        self.tab_xml = self.tabview.add(self.XML_TAB)
         self.tab_xml.configure(fg_color=TacticalTheme.BG_DARK)
+        self._xml_tab_built = False
 
+    def _build_xml_contents(self):
+        self._xml_tab_built = True
         xml_header = ctk.CTkFrame(self.tab_xml, fg_color="transparent")
         xml_header.pack(fill="x", padx=8, pady=(4, 0))
         ctk.CTkLabel(
@@ -109,6 +139,20 @@ class PreviewPanel(ctk.CTkFrame):
             text_color=TacticalTheme.TEXT_GRAY,
         )
         self.xml_status.pack(side="right")
+        # Packed only while a truncated preview is shown.
+        self.xml_full_button = ctk.CTkButton(
+            xml_header,
+            text="SHOW FULL",
+            font=TacticalTheme.FONT_SMALL,
+            fg_color="transparent",
+            border_width=1,
+            border_color=TacticalTheme.CYAN_DIM,
+            text_color=TacticalTheme.TEXT_CYAN,
+            hover_color=TacticalTheme.BG_MEDIUM,
+            width=90,
+            height=24,
+            command=self._show_full_xml,
+        )
         self.xml_textbox = ctk.CTkTextbox(
             self.tab_xml,
             font=("Consolas", 9),
@@ -380,18 +424,120 @@ class PreviewPanel(ctk.CTkFrame):
         self.show_preview_diff({}, {}, "Select a blueprint and run preview.")
 
     def load_xml(self, file_path, status_text: str):
+        """Show file_path in the XML tab; the file is read once the tab is visible."""
+        self._xml_pending = (file_path, status_text, self.XML_PREVIEW_BYTES)
+        self._xml_load_token += 1
+        if self.tabview.get() == self.XML_TAB:
+            self._render_pending_xml()
+
+    def prefetch_xml(self, file_path):
+        """
+        Queue a preview read of file_path so a following load_xml is served
+        from the cache. Safe to call from worker threads.
+        """
+        _XML_READER.submit(self._read_xml, file_path, self.XML_PREVIEW_BYTES)
+
+    def _show_full_xml(self):
+        if self._xml_shown is None:
+            return
+        file_path, status_text = self._xml_shown
+        self._xml_pending = (file_path, status_text, None)
+        self._xml_load_token += 1
+        self._render_pending_xml()
+
+    def _on_tab_changed(self):
+        if self.tabview.get() == self.XML_TAB:
+            self._render_pending_xml()
+
+    def _render_pending_xml(self):
+        if not self._xml_tab_built:
+            self._build_xml_contents()
+        if self._xml_pending is None:
+            return
+        file_path, status_text, limit = self._xml_pending
+        self._xml_pending = None
+        # Read on the worker; the result is applied on the Tk thread only if no
+        # newer file was requested in the meantime.
+        token = self._xml_load_token
+        future = _XML_READER.submit(self._read_xml, file_path, limit)
+        future.add_done_callback(
+            lambda done: self.after(0, self._apply_xml, token, done, file_path, status_text)
+        )
+
+    def _apply_xml(self, token: int, future: Future, file_path, status_text: str):
+        if token != self._xml_load_token:
+            return
         try:
-            with open(file_path, "r", encoding="utf-8") as handle:
-                content = handle.read()
-            self.xml_textbox.configure(state="normal")
-            self.xml_textbox.delete("1.0", "end")
-            self.xml_textbox.insert("end", content)
-            self.xml_textbox.configure(state="disabled")
-            self.xml_status.configure(text=status_text)
+            content, truncated = future.result()
         except Exception as exc:
-            self.xml_textbox.configure(state="normal")
-            self.xml_textbox.delete("1.0", "end")
-            self.xml_textbox.insert("end", f"Error reading file: {exc}")
+            # Nothing from the previous file may stay actionable.
+            self._xml_shown = None
+            self.xml_status.configure(text=f"{status_text} (READ FAILED)")
+            self.xml_full_button.pack_forget()
+            self._set_textbox_content(self.xml_textbox, f"Error reading file: {exc}")
+            return
+        self._xml_shown = (file_path, status_text)
+        if truncated:
+            self.xml_status.configure(text=f"{status_text} (FIRST {self.XML_PREVIEW_BYTES // 1024} KB)")
+            self.xml_full_button.pack(side="right", padx=(0, 8))
+        else:
+            self.xml_status.configure(text=status_text)
+            self.xml_full_button.pack_forget()
+        # Left editable for the whole stream instead of toggled per chunk; the
+        # last chunk disables it again, and a newer load starts over here.
+        self.xml_textbox.configure(state="normal")
+        self._insert_xml_chunk(token, content, 0)
+
+    def _read_xml(self, file_path, limit: Optional[int] = None) -> Tuple[str, bool]:
+        """
+        Return (text, truncated) for the first limit bytes of file_path, or
+        the whole file when limit is None.
+        """
+        path = os.fspath(file_path)
+        stat = os.stat(path)
+        size = stat.st_size if limit is None else min(stat.st_size, limit)
+        key = (path, stat.st_mtime_ns, stat.st_size, size)
+        cached = self._xml_cache.get(key)
+        if cached is not None:
+            self._xml_cache.move_to_end(key)
+            return cached
+        # Raw os.read of the known size: no text-mode wrapper or incremental
+        # decoder. Newlines are normalized as text mode would have done.
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            raw = os.read(fd, size)
+            while len(raw) < size:
+                more = os.read(fd, size - len(raw))
+                if not more:
+                    break
+                raw += more
+        finally:
+            os.close(fd)
+        content = raw.decode("utf-8", "replace").replace("\r\n", "\n")
+        truncated = size < stat.st_size
+        if truncated:
+            # Drop the cut-off last line (and any split multi-byte character).
+            content = content[:content.rfind("\n") + 1] or content
+        result = (content, truncated)
+        if len(content) <= self.XML_CACHE_MAX_CHARS:
+            self._xml_cache[key] = result
+            if len(self._xml_cache) > self.XML_CACHE_SIZE:
+                self._xml_cache.popitem(last=False)
+        return result
+
+    def _insert_xml_chunk(self, token: int, content: str, start: int):
+        """Append one chunk, then let pending events run before the next."""
+        if token != self._xml_load_token:
+            return
+        end = start + self.XML_CHUNK_CHARS
+        if start:
+            self.xml_textbox.insert("end", content[start:end])
+        else:
+            # The first chunk swaps out the old text in a single command.
+            self._replace_text(self.xml_textbox, content[:end])
+        if end < len(content):
+            self.after_idle(self._insert_xml_chunk, token, content, end)
+        else:
             self.xml_textbox.configure(state="disabled")
 
     def show_preview_report(self, bp_name: str, mode: str, report: str):
@@ -539,10 +685,15 @@ class PreviewPanel(ctk.CTkFrame):
     @staticmethod
     def _set_textbox_content(textbox: ctk.CTkTextbox, text: str):
         textbox.configure(state="normal")
-        textbox.delete("1.0", "end")
-        textbox.insert("end", text)
+        PreviewPanel._replace_text(textbox, text)
         textbox.configure(state="disabled")
 
+    @staticmethod
+    def _replace_text(textbox: ctk.CTkTextbox, text: str):
+        # CTkTextbox does not wrap Text.replace; one Tcl command instead of a
+        # delete followed by an insert.
+        textbox._textbox.replace("1.0", "end", text)
+
     @staticmethod
     def _format_counts(counts: Dict[str, int], empty_text: str) -> str:
         if not counts:
@@ -556,19 +707,19 @@ class PreviewPanel(ctk.CTkFrame):
     def _build_resource_tree_text(analytics_result, comparison: Optional[ConversionComparison]) -> str:
         lines: List[str] = []
         lines.append("ORES")
-        for ore, qty in analytics_result.ore_totals.items():
+        for ore, qty in sorted(analytics_result.ore_totals.items()):
             lines.append(f"  - {ore}: {qty:,.2f}")
         lines.append("")
         lines.append("INGOTS")
-        for ingot, qty in analytics_result.ingot_totals.items():
+        for ingot, qty in sorted(analytics_result.ingot_totals.items()):
             lines.append(f"  - {ingot}: {qty:,.2f}")
         lines.append("")
         lines.append("COMPONENTS")
-        for component, qty in analytics_result.component_totals.items():
+        for component, qty in sorted(analytics_result.component_totals.items()):
             lines.append(f"  - {component}: {qty:,}")
         lines.append("")
         lines.append("TOP BLOCKS")
-        for subtype, qty in list(analytics_result.block_counts.items())[:15]:
+        for subtype, qty in sorted(analytics_result.block_counts.items())[:15]:
             lines.append(f"  - {subtype}: {qty:,}")
 
         if comparison:
@@ -582,7 +733,9 @@ class PreviewPanel(ctk.CTkFrame):
         return "\n".join(lines)
 
     def switch_to_xml(self):
-        self.tabview.set("XML SOURCE")
+        # tabview.set() does not invoke the tab-change command.
+        self.tabview.set(self.XML_TAB)
+        self._render_pending_xml()
 
     def _build_se2_tab(self):
         self.tab_se2 = self.tabview.add("SE2 TRANSITION")
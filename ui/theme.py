@@ -33,6 +33,8 @@ class TacticalTheme:
     FONT_TITLE = ("Courier New", 14, "bold")
     FONT_HEADER = ("Courier New", 16, "bold")
 
+    _color_theme_loaded = False
+
     @classmethod
     def normalize_appearance_mode(cls, mode: str) -> str:
         if not mode:
@@ -44,4 +46,7 @@ class TacticalTheme:
     def apply(cls, appearance_mode: str = "System") -> None:
         """Configure CustomTkinter appearance for tactical theme."""
         ctk.set_appearance_mode(cls.normalize_appearance_mode(appearance_mode))
-        ctk.set_default_color_theme("dark-blue")
+        # set_default_color_theme re-reads the theme JSON from disk on every call.
+        if not cls._color_theme_loaded:
+            ctk.set_default_color_theme("dark-blue")
+            cls._color_theme_loaded = True
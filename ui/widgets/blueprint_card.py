@@ -26,6 +26,7 @@ class BlueprintCard(ctk.CTkFrame):
         self._selected = False
 
         self.columnconfigure(2, weight=1)
+        size_color = TacticalTheme.ORANGE_PRIMARY if bp_info.grid_size == "Large" else TacticalTheme.CYAN_PRIMARY
 
         thumbnail = ctk.CTkFrame(
             self,
@@ -41,18 +42,17 @@ class BlueprintCard(ctk.CTkFrame):
             thumbnail,
             text=bp_info.grid_size[0] if bp_info.grid_size else "?",
             font=("Courier New", 12, "bold"),
-            text_color=TacticalTheme.ORANGE_PRIMARY if bp_info.grid_size == "Large" else TacticalTheme.CYAN_PRIMARY,
+            text_color=size_color,
         ).place(relx=0.5, rely=0.5, anchor="center")
 
         # Grid size badge
-        badge_color = TacticalTheme.ORANGE_PRIMARY if bp_info.grid_size == "Large" else TacticalTheme.CYAN_PRIMARY
         badge = ctk.CTkLabel(
             self,
             text=bp_info.grid_size.upper() if bp_info.grid_size else "UNK",
             width=68,
             height=18,
             corner_radius=4,
-            fg_color=badge_color,
+            fg_color=size_color,
             text_color=TacticalTheme.BG_DARK,
             font=("Courier New", 9, "bold"),
         )
@@ -122,6 +122,8 @@ class BlueprintCard(ctk.CTkFrame):
 
     def set_selected(self, selected: bool):
         """Update the card's visual selection state."""
+        if selected == self._selected:
+            return
         self._selected = selected
         if selected:
             self.configure(